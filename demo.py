@@ -6,48 +6,154 @@ This script demonstrates the capabilities of InkForge by generating sample conte
 for different scenarios. It's designed to work with or without a real API key.
 """
 
+import argparse
+import asyncio
 import os
-import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
-
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import inkforge.core.generator as generator_module
+from inkforge.core.ai_service import AIResponse
 from inkforge.core.config import Config
-from inkforge.core.generator import ContentGenerator
+from inkforge.core.generator import ContentGenerator, DEFAULT_CACHE_DIR
 from inkforge.models.content import (
     ContentRequest, Country, Industry, Platform, Tone, Goal, OutputFormat
 )
 from inkforge.utils.formatters import format_content
 
-# Rich for beautiful output
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich import print as rprint
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    def rprint(*args, **kwargs):
-        print(*args, **kwargs)
+# Rows of the "Generation Parameters" table: (label, request attribute)
+_PARAM_FIELDS = (
+    ("Topic", attrgetter("topic")),
+    ("Country", attrgetter("country.value")),
+    ("Industry", attrgetter("industry.value")),
+    ("Platform", attrgetter("platform.value")),
+    ("Tone", attrgetter("tone.value")),
+    ("Goal", attrgetter("goal.value")),
+)
+
+
+# Demo scenarios: (name, request), built once at import
+_DEMO_SCENARIOS = (
+    (
+        "🇺🇸 Medium Article (English)",
+        ContentRequest(
+            topic="The Future of Remote Work",
+            country=Country.US,
+            industry=Industry.BUSINESS,
+            platform=Platform.MEDIUM,
+            tone=Tone.PROFESSIONAL,
+            goal=Goal.ENGAGEMENT,
+            length=800
+        )
+    ),
+    (
+        "🇨🇳 Zhihu Post (Chinese)",
+        ContentRequest(
+            topic="人工智能在医疗领域的应用",
+            country=Country.CN,
+            industry=Industry.HEALTH,
+            platform=Platform.ZHIHU,
+            tone=Tone.ANALYTICAL,
+            goal=Goal.COMMENTS,
+            length=600
+        )
+    ),
+    (
+        "🐦 Twitter Thread",
+        ContentRequest(
+            topic="10 AI Tools Every Developer Should Know",
+            country=Country.US,
+            industry=Industry.TECHNOLOGY,
+            platform=Platform.TWITTER,
+            tone=Tone.CASUAL,
+            goal=Goal.SHARES,
+            length=400
+        )
+    ),
+)
+
+
+# Canned AI output used in mock mode
+_MOCK_CONTENT = (
+    Path(__file__).parent / "demo_fixtures" / "mock_response.md"
+).read_text(encoding="utf-8").rstrip("\n")
+
+_FIXED_RESPONSE = AIResponse(
+    content=_MOCK_CONTENT,
+    model="mistralai/mistral-small-3.2-24b-instruct:free",
+    usage={"prompt_tokens": 150, "completion_tokens": 350, "total_tokens": 500},
+    finish_reason="stop",
+    metadata={"response_time": 2.3, "status_code": 200},
+)
+
+
+class _StubAIService:
+    """Stand-in for AIService that returns canned content without network access."""
+
+    def __init__(self, config: Config):
+        """Initialize stub service."""
+        self.config = config
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+
+    async def aclose(self):
+        """Nothing to close."""
+
+    async def generate_content(self, prompt, generation_config=None) -> AIResponse:
+        """Return the canned response."""
+        return _FIXED_RESPONSE
+
+    async def generate_content_stream(self, prompt, generation_config=None):
+        """Yield the canned response line by line."""
+        for line in _MOCK_CONTENT.splitlines(keepends=True):
+            yield line
 
 
 class InkForgeDemo:
     """InkForge demonstration class."""
+
+    # Upper bound on in-flight generations to stay within OpenRouter rate limits
+    MAX_CONCURRENT_SCENARIOS = 5
+
+    # Trailing characters of streamed output shown per scenario while generating
+    STREAM_PREVIEW_CHARS = 600
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """Initialize the demo."""
-        self.console = Console() if RICH_AVAILABLE else None
+        # Rich is imported here rather than at module level so --help stays fast
+        try:
+            from rich.console import Group
+            from rich.live import Live
+            from rich.panel import Panel
+            from rich.table import Table
+            from rich.text import Text
+            from inkforge.utils.console import get_console
+        except ImportError:
+            self.console = None
+        else:
+            self.console = get_console()
+            self._Group = Group
+            self._Live = Live
+            self._Panel = Panel
+            self._Table = Table
+            self._Text = Text
+        self._live = None
+        self._stream_views = {}
+        self._original_ai_service = None
         self.config = None
         self.generator = None
+        self.use_cache = use_cache
+        self.output_dir = Path("demo_output")
         
     def setup(self):
         """Set up InkForge configuration."""
         if self.console:
-            self.console.print(Panel.fit(
+            self.console.print(self._Panel.fit(
                 "[bold blue]🔥 InkForge Demo[/bold blue]\n"
                 "AI-powered high-quality blog content generator",
                 border_style="blue"
@@ -79,77 +185,9 @@ class InkForgeDemo:
     
     def setup_mock_mode(self):
         """Set up mock mode for demonstration."""
-        from unittest.mock import Mock, patch
-        
-        # Mock the AI service
-        mock_response = Mock()
-        mock_response.content = """# The Future of AI in Content Creation
-
-Artificial Intelligence is revolutionizing how we create and consume content across the globe.
-
-## The Current Landscape
-
-Content creators today face unprecedented challenges:
-- Information overload
-- Platform-specific requirements
-- Global audience expectations
-- Quality vs. quantity balance
-
-## AI-Powered Solutions
-
-### Personalization at Scale
-AI enables creators to tailor content for different:
-- **Countries**: Adapting cultural nuances and preferences
-- **Platforms**: Optimizing for Medium, Twitter, LinkedIn, etc.
-- **Industries**: Finance, healthcare, technology, and more
-
-### Quality Enhancement
-Modern AI tools can:
-1. Improve writing clarity and engagement
-2. Suggest better headlines and hooks
-3. Optimize content structure
-4. Add platform-specific elements
-
-## The InkForge Advantage
-
-InkForge combines multiple AI capabilities:
-- **Smart Prompting**: Context-aware prompt generation
-- **Humanization**: Making AI content feel natural
-- **Platform Optimization**: Tailored for each social platform
-- **Global Localization**: Supporting 10+ countries and languages
-
-## Looking Forward
-
-The future of AI-powered content creation will focus on:
-- Better understanding of cultural contexts
-- More sophisticated engagement optimization
-- Seamless integration with creator workflows
-- Ethical AI practices and transparency
-
-## Conclusion
-
-As we move forward, tools like InkForge represent the next evolution in content creation - not replacing human creativity, but amplifying it.
-
-What's your experience with AI content tools? Share your thoughts!
-
-Tags: AI, content creation, blogging, technology
-Engagement Tips: Ask readers about their AI tool experiences, Share specific use cases"""
-        
-        mock_response.model = "mistralai/mistral-small-3.2-24b-instruct:free"
-        mock_response.usage = {"prompt_tokens": 150, "completion_tokens": 350, "total_tokens": 500}
-        mock_response.finish_reason = "stop"
-        mock_response.metadata = {"response_time": 2.3, "status_code": 200}
-        
-        # Patch the AI service
-        patcher = patch('inkforge.core.ai_service.AIService')
-        mock_service = patcher.start()
-        mock_instance = Mock()
-        mock_service.return_value.__aenter__.return_value = mock_instance
-        mock_service.return_value.__aexit__.return_value = None
-        mock_instance.generate_content.return_value = mock_response
-        
-        # Store patcher for cleanup
-        self._patcher = patcher
+        # Swap in the stub service where the generator looks it up
+        self._original_ai_service = generator_module.AIService
+        generator_module.AIService = _StubAIService
         
         # Set up config
         self.config = Config()
@@ -160,131 +198,130 @@ Engagement Tips: Ask readers about their AI tool experiences, Share specific use
         """Set up real mode with actual API."""
         self.config = Config()
         self.config.openrouter_api_key = api_key
-        self.generator = ContentGenerator(self.config)
+        # Only real responses are cached; mock mode would poison the cache
+        cache_dir = DEFAULT_CACHE_DIR if self.use_cache else None
+        self.generator = ContentGenerator(self.config, cache_dir=cache_dir)
         
         if self.console:
             self.console.print("[green]✅ Real API mode enabled[/green]")
         else:
             print("✅ Real API mode enabled")
     
-    def run_demo_scenarios(self):
-        """Run various demo scenarios."""
-        scenarios = [
-            {
-                "name": "🇺🇸 Medium Article (English)",
-                "request": ContentRequest(
-                    topic="The Future of Remote Work",
-                    country=Country.US,
-                    industry=Industry.BUSINESS,
-                    platform=Platform.MEDIUM,
-                    tone=Tone.PROFESSIONAL,
-                    goal=Goal.ENGAGEMENT,
-                    length=800
-                )
-            },
-            {
-                "name": "🇨🇳 Zhihu Post (Chinese)",
-                "request": ContentRequest(
-                    topic="人工智能在医疗领域的应用",
-                    country=Country.CN,
-                    industry=Industry.HEALTH,
-                    platform=Platform.ZHIHU,
-                    tone=Tone.ANALYTICAL,
-                    goal=Goal.COMMENTS,
-                    length=600
-                )
-            },
-            {
-                "name": "🐦 Twitter Thread",
-                "request": ContentRequest(
-                    topic="10 AI Tools Every Developer Should Know",
-                    country=Country.US,
-                    industry=Industry.TECHNOLOGY,
-                    platform=Platform.TWITTER,
-                    tone=Tone.CASUAL,
-                    goal=Goal.SHARES,
-                    length=400
-                )
-            }
-        ]
-        
-        for i, scenario in enumerate(scenarios, 1):
-            self.run_scenario(i, scenario["name"], scenario["request"])
+    async def run_demo_scenarios(self):
+        """Run various demo scenarios concurrently."""
+        self.output_dir.mkdir(exist_ok=True)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SCENARIOS)
+
+        try:
+            if self.console:
+                # A single live display for all scenarios; Rich allows only one at a time
+                with self._Live(console=self.console, refresh_per_second=8, transient=True) as live:
+                    self._live = live
+                    try:
+                        await asyncio.gather(*[
+                            self.run_scenario(i, name, request, semaphore)
+                            for i, (name, request) in enumerate(_DEMO_SCENARIOS, 1)
+                        ])
+                    finally:
+                        self._live = None
+            else:
+                print("Generating content...")
+                await asyncio.gather(*[
+                    self.run_scenario(i, name, request, semaphore)
+                    for i, (name, request) in enumerate(_DEMO_SCENARIOS, 1)
+                ])
+        finally:
+            # All scenarios share the generator's HTTP client; close it on this loop
+            await self.generator.aclose()
     
-    def run_scenario(self, number: int, name: str, request: ContentRequest):
+    async def run_scenario(
+        self,
+        number: int,
+        name: str,
+        request: ContentRequest,
+        semaphore: asyncio.Semaphore,
+    ):
         """Run a single demo scenario."""
+        platform = request.platform.value
+        async with semaphore:
+            stream = self.generator.generate_stream(request)
+            streamed = ""
+            async for chunk in stream:
+                if self._live is not None:
+                    streamed += chunk
+                    self._update_stream_view(number, name, streamed)
+            response = stream.response
+
+        if self._live is not None:
+            self._stream_views.pop(number, None)
+            self._live.update(self._Group(*self._stream_views.values()))
+
+        # Everything below runs without awaiting, so each scenario renders as one block
         if self.console:
             self.console.print(f"\n[bold cyan]Demo {number}: {name}[/bold cyan]")
             
             # Show request details
-            table = Table(title="Generation Parameters", show_header=False)
-            table.add_column("Parameter", style="bold blue")
-            table.add_column("Value", style="green")
-            
-            table.add_row("Topic", request.topic)
-            table.add_row("Country", request.country.value)
-            table.add_row("Industry", request.industry.value)
-            table.add_row("Platform", request.platform.value)
-            table.add_row("Tone", request.tone.value)
-            table.add_row("Goal", request.goal.value)
-            table.add_row("Length", f"~{request.length} words")
-            
-            self.console.print(table)
-            
-            # Generate with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                task = progress.add_task("Generating content...", total=None)
-                response = self.generator.generate(request)
-                progress.update(task, completed=True)
+            self.console.print(self._make_param_table(request))
         else:
             print(f"\nDemo {number}: {name}")
             print(f"Topic: {request.topic}")
-            print(f"Platform: {request.platform.value}")
-            print("Generating content...")
-            response = self.generator.generate(request)
+            print(f"Platform: {platform}")
         
         # Display results
         self.display_results(response)
         
-        # Save to file
-        output_dir = Path("demo_output")
-        output_dir.mkdir(exist_ok=True)
-        
-        filename = f"demo_{number}_{request.platform.value}"
-        
-        # Save as Markdown
-        md_file = output_dir / f"{filename}.md"
-        format_content(response, OutputFormat.MARKDOWN, md_file)
+        # Save as Markdown off the event loop so other scenarios keep streaming
+        md_file = self.output_dir / f"demo_{number}_{platform}.md"
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, format_content, response, OutputFormat.MARKDOWN, md_file)
         
         if self.console:
             self.console.print(f"[dim]💾 Saved to: {md_file}[/dim]")
         else:
             print(f"💾 Saved to: {md_file}")
     
+    def _make_param_table(self, request: ContentRequest):
+        """Build the generation parameters table for a request."""
+        table = self._Table(title="Generation Parameters", show_header=False)
+        table.add_column("Parameter", style="bold blue")
+        table.add_column("Value", style="green")
+        
+        for label, getter in _PARAM_FIELDS:
+            table.add_row(label, getter(request))
+        table.add_row("Length", f"~{request.length} words")
+        
+        return table
+    
+    def _update_stream_view(self, number: int, name: str, streamed: str):
+        """Show the latest streamed output of a scenario in the live display."""
+        self._stream_views[number] = self._Panel(
+            self._Text(streamed[-self.STREAM_PREVIEW_CHARS:]),
+            title=f"Demo {number}: {name}",
+            border_style="cyan",
+            height=12,
+        )
+        self._live.update(self._Group(*self._stream_views.values()))
+    
     def display_results(self, response):
         """Display generation results."""
         if self.console:
             # Title
-            self.console.print(Panel.fit(
+            self.console.print(self._Panel.fit(
                 f"[bold green]{response.title}[/bold green]",
                 border_style="green",
                 title="Generated Title"
             ))
             
             # Content preview
-            content_preview = response.content[:300] + "..." if len(response.content) > 300 else response.content
-            self.console.print(Panel(
+            content_preview = response.preview(300)
+            self.console.print(self._Panel(
                 content_preview,
                 title="Content Preview",
                 border_style="blue"
             ))
             
             # Stats
-            stats_table = Table(show_header=False)
+            stats_table = self._Table(show_header=False)
             stats_table.add_column("Metric", style="bold")
             stats_table.add_column("Value", style="cyan")
             
@@ -292,7 +329,7 @@ Engagement Tips: Ask readers about their AI tool experiences, Share specific use
             stats_table.add_row("Read Time", f"{response.estimated_read_time} min")
             
             if response.tags:
-                stats_table.add_row("Tags", ", ".join(response.tags))
+                stats_table.add_row("Tags", response.tags_str)
             
             self.console.print(stats_table)
             
@@ -306,21 +343,32 @@ Engagement Tips: Ask readers about their AI tool experiences, Share specific use
             print(f"📊 Word Count: {response.word_count}")
             print(f"⏱️  Read Time: {response.estimated_read_time} min")
             print(f"\n📄 Content Preview:")
-            print(response.content[:300] + "..." if len(response.content) > 300 else response.content)
+            print(response.preview(300))
     
     def cleanup(self):
         """Clean up resources."""
-        if hasattr(self, '_patcher'):
-            self._patcher.stop()
+        if self.generator is not None:
+            self.generator.close()
+        if self._original_ai_service is not None:
+            generator_module.AIService = self._original_ai_service
+            self._original_ai_service = None
 
 
 def main():
     """Main demo function."""
-    demo = InkForgeDemo()
+    parser = argparse.ArgumentParser(description="InkForge demo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate content instead of reusing cached responses",
+    )
+    args = parser.parse_args()
+
+    demo = InkForgeDemo(use_cache=not args.no_cache)
     
     try:
         demo.setup()
-        demo.run_demo_scenarios()
+        asyncio.run(demo.run_demo_scenarios())
         
         if demo.console:
             demo.console.print("\n[bold green]🎉 Demo completed successfully![/bold green]")
@@ -9,36 +9,57 @@ This script demonstrates all the features of InkForge including:
 - Quality control and retry mechanisms
 """
 
+import argparse
 import os
 import sys
-from pathlib import Path
-
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from typing import NamedTuple, Tuple
 
 from inkforge.core.config import Config
-from inkforge.core.generator import ContentGenerator
+from inkforge.core.generator import ContentGenerator, DEFAULT_CACHE_DIR
 from inkforge.models.content import (
     ContentRequest, Country, Industry, Platform, Tone, Goal, OutputFormat
 )
 
-# Rich for beautiful output
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich import print as rprint
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    def rprint(*args, **kwargs):
-        print(*args, **kwargs)
+
+class Scenario(NamedTuple):
+    """A demo scenario: what to generate and which formats to save."""
+    name: str
+    request: ContentRequest
+    formats: Tuple[OutputFormat, ...]
+
+
+def generate_scenarios(generator, scenarios):
+    """Generate all scenarios as one batch, returning a response or exception per scenario."""
+    return generator.generate_batch(
+        [scenario.request for scenario in scenarios],
+        auto_save=True,
+        save_formats=[list(scenario.formats) for scenario in scenarios],
+        return_exceptions=True,
+    )
 
 
 def main():
     """Main demo function."""
-    console = Console() if RICH_AVAILABLE else None
+    parser = argparse.ArgumentParser(description="InkForge complete demo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate content instead of reusing cached responses",
+    )
+    args = parser.parse_args()
+
+    # Rich is only worth importing when writing to a terminal
+    console = None
+    if sys.stdout.isatty():
+        try:
+            from rich.panel import Panel
+            from rich.table import Table
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            from inkforge.utils.console import get_console
+        except ImportError:
+            pass
+        else:
+            console = get_console()
     
     if console:
         console.print(Panel.fit(
@@ -63,7 +84,7 @@ def main():
     
     # Initialize generator
     config = Config()
-    generator = ContentGenerator(config)
+    generator = ContentGenerator(config, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
     
     if console:
         console.print(f"[green]✅ Session started: {generator.session_id}[/green]")
@@ -74,9 +95,9 @@ def main():
     
     # Demo scenarios
     scenarios = [
-        {
-            "name": "🇺🇸 English Tech Article for Medium",
-            "request": ContentRequest(
+        Scenario(
+            "🇺🇸 English Tech Article for Medium",
+            ContentRequest(
                 topic="The Future of AI-Powered Development Tools",
                 country=Country.US,
                 industry=Industry.TECHNOLOGY,
@@ -86,11 +107,11 @@ def main():
                 keywords=["AI", "development", "tools", "productivity"],
                 length=600
             ),
-            "formats": [OutputFormat.MARKDOWN, OutputFormat.HTML, OutputFormat.JSON]
-        },
-        {
-            "name": "🇨🇳 Chinese Finance Post for Zhihu",
-            "request": ContentRequest(
+            (OutputFormat.MARKDOWN, OutputFormat.HTML, OutputFormat.JSON)
+        ),
+        Scenario(
+            "🇨🇳 Chinese Finance Post for Zhihu",
+            ContentRequest(
                 topic="2024年投资理财新趋势分析",
                 country=Country.CN,
                 industry=Industry.FINANCE,
@@ -100,11 +121,11 @@ def main():
                 keywords=["投资", "理财", "趋势", "2024"],
                 length=500
             ),
-            "formats": [OutputFormat.MARKDOWN, OutputFormat.PLAIN]
-        },
-        {
-            "name": "🐦 Twitter Thread about AI",
-            "request": ContentRequest(
+            (OutputFormat.MARKDOWN, OutputFormat.PLAIN)
+        ),
+        Scenario(
+            "🐦 Twitter Thread about AI",
+            ContentRequest(
                 topic="5 AI Tools That Will Change Your Workflow",
                 country=Country.US,
                 industry=Industry.TECHNOLOGY,
@@ -113,21 +134,36 @@ def main():
                 goal=Goal.SHARES,
                 length=300
             ),
-            "formats": [OutputFormat.MARKDOWN, OutputFormat.PLAIN]
-        }
+            (OutputFormat.MARKDOWN, OutputFormat.PLAIN)
+        )
     ]
     
-    # Run scenarios
-    for i, scenario in enumerate(scenarios, 1):
+    # Generate all scenarios concurrently
+    if console:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Generating {len(scenarios)} scenarios...", total=None)
+            results = generate_scenarios(generator, scenarios)
+            progress.update(task, completed=True)
+    else:
+        print(f"\nGenerating {len(scenarios)} scenarios...")
+        results = generate_scenarios(generator, scenarios)
+
+    # Show results
+    for i, (scenario, response) in enumerate(zip(scenarios, results), 1):
+        formats_str = ", ".join(f.value for f in scenario.formats)
         if console:
-            console.print(f"\n[bold cyan]Demo {i}/3: {scenario['name']}[/bold cyan]")
+            console.print(f"\n[bold cyan]Demo {i}/3: {scenario.name}[/bold cyan]")
             
             # Show request details
             table = Table(title="Generation Parameters", show_header=False)
             table.add_column("Parameter", style="bold blue")
             table.add_column("Value", style="green")
             
-            req = scenario["request"]
+            req = scenario.request
             table.add_row("Topic", req.topic)
             table.add_row("Country", req.country.value)
             table.add_row("Industry", req.industry.value)
@@ -139,37 +175,15 @@ def main():
                 table.add_row("Keywords", ", ".join(req.keywords))
             
             console.print(table)
-            
-            # Generate with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Generating content...", total=None)
-                try:
-                    response = generator.generate(
-                        scenario["request"], 
-                        auto_save=True, 
-                        save_formats=scenario["formats"]
-                    )
-                    progress.update(task, completed=True)
-                except Exception as e:
-                    progress.update(task, description=f"❌ Failed: {str(e)}")
-                    console.print(f"[red]Generation failed: {e}[/red]")
-                    continue
+
+            if isinstance(response, Exception):
+                console.print(f"[red]Generation failed: {response}[/red]")
+                continue
         else:
-            print(f"\nDemo {i}/3: {scenario['name']}")
-            print(f"Topic: {scenario['request'].topic}")
-            print("Generating content...")
-            try:
-                response = generator.generate(
-                    scenario["request"], 
-                    auto_save=True, 
-                    save_formats=scenario["formats"]
-                )
-            except Exception as e:
-                print(f"❌ Generation failed: {e}")
+            print(f"\nDemo {i}/3: {scenario.name}")
+            print(f"Topic: {scenario.request.topic}")
+            if isinstance(response, Exception):
+                print(f"❌ Generation failed: {response}")
                 continue
         
         # Display results
@@ -182,7 +196,7 @@ def main():
             ))
             
             # Content preview
-            content_preview = response.content[:200] + "..." if len(response.content) > 200 else response.content
+            content_preview = response.preview(200)
             console.print(Panel(
                 content_preview,
                 title="Content Preview",
@@ -199,22 +213,22 @@ def main():
             stats_table.add_row("Quality Score", f"{response.metadata.get('quality_score', 'N/A')}")
             
             if response.tags:
-                stats_table.add_row("Tags", ", ".join(response.tags))
+                stats_table.add_row("Tags", response.tags_str)
             
             console.print(stats_table)
             
             # Show formats saved
-            formats_str = ", ".join([f.value for f in scenario["formats"]])
             console.print(f"[dim]💾 Saved formats: {formats_str}[/dim]")
             
         else:
             print(f"📝 Title: {response.title}")
             print(f"📊 Word Count: {response.word_count}")
             print(f"⏱️  Read Time: {response.estimated_read_time} min")
-            print(f"💾 Saved formats: {', '.join([f.value for f in scenario['formats']])}")
+            print(f"💾 Saved formats: {formats_str}")
     
     # Show session summary
     session_summary = generator.get_session_summary()
+    generator.close()
     
     if console:
         console.print("\n[bold green]🎉 Demo completed![/bold green]")
@@ -18,9 +18,14 @@ __author__ = "InkForge Contributors"
 __email__ = "contributors@inkforge.dev"
 __license__ = "MIT"
 
-from .core.generator import ContentGenerator
-from .core.config import Config
-from .models.content import ContentRequest, ContentResponse
+# Public names are imported on first access so that importing a submodule
+# (e.g. the CLI) does not load the whole package
+_LAZY_IMPORTS = {
+    "ContentGenerator": ".core.generator",
+    "Config": ".core.config",
+    "ContentRequest": ".models.content",
+    "ContentResponse": ".models.content",
+}
 
 __all__ = [
     "__version__",
@@ -32,3 +37,12 @@ __all__ = [
     "ContentRequest",
     "ContentResponse",
 ]
+
+
+def __getattr__(name):
+    """Import public names lazily."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,30 +2,29 @@
 InkForge CLI - Interactive command-line interface for AI-powered blog content generation.
 """
 
+import functools
 import os
-import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Tuple
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.text import Text
+from rich.console import Console, Group
 from rich import print as rprint
 
-# Load environment variables early
-from dotenv import load_dotenv
-load_dotenv()
-
 from .models.content import (
     Country, Industry, Platform, Tone, Goal, OutputFormat,
-    ContentRequest, GenerationConfig
+    ContentRequest
 )
 from .core.config import Config
-from .core.generator import ContentGenerator
+from .utils import jsonutil
+from .utils.fileio import write_atomic
+from .utils.sessions import read_session_data, session_mtime_ns
+
+# Panels, tables, prompts and styled text are only needed by the commands that
+# render them, so they are imported there to keep startup (and --help) fast
+if TYPE_CHECKING:
+    from rich.table import Table
 
 # Initialize Typer app and Rich console
 app = typer.Typer(
@@ -36,21 +35,57 @@ app = typer.Typer(
 )
 console = Console()
 
+# Choices offered in interactive mode
+COUNTRY_CHOICES = [c.value for c in Country]
+INDUSTRY_CHOICES = [i.value for i in Industry]
+PLATFORM_CHOICES = [p.value for p in Platform]
+TONE_CHOICES = [t.value for t in Tone]
+GOAL_CHOICES = [g.value for g in Goal]
+
+# What interactive mode offers to customize; "settings" covers tone, goal and the rest
+INTERACTIVE_SECTIONS = ("country", "industry", "platform", "settings")
+
+# Names accepted by --save-formats
+SAVE_FORMAT_ALIASES = {
+    'md': OutputFormat.MARKDOWN,
+    'markdown': OutputFormat.MARKDOWN,
+    'html': OutputFormat.HTML,
+    'json': OutputFormat.JSON,
+    'txt': OutputFormat.PLAIN,
+    'plain': OutputFormat.PLAIN
+}
+
+# Per-session summaries cached by list_recent_sessions, keyed by session ID
+SESSIONS_INDEX_FILE = ".sessions_index.json"
+
+# Upper bound on threads reading session files that changed since the last listing
+SESSION_LOAD_WORKERS = 16
+
 # Global config instance
 config: Optional[Config] = None
 config_file_path: Optional[Path] = None
 debug_mode: bool = False
 
 
+@functools.lru_cache(maxsize=8)
+def _build_config(config_file: str, debug: bool) -> Config:
+    """Build a config once per (config file, debug) pair.
+
+    Edits made to the config file by another process are not picked up until
+    the cache is cleared, which ``config --reset`` does.
+    """
+    return Config(config_file=Path(config_file) if config_file else None, debug=debug)
+
+
 def get_config() -> Config:
     """Get or initialize global config."""
     global config
     if config is None:
-        config = Config(config_file=config_file_path, debug=debug_mode)
+        config = _build_config(str(config_file_path) if config_file_path else "", debug_mode)
     return config
 
 
-@app.callback()
+@app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Show version and exit"),
@@ -67,16 +102,17 @@ def main(
         from . import __version__
         rprint(f"InkForge version {__version__}")
         raise typer.Exit()
+
+    if ctx.invoked_subcommand is None:
+        console.print(ctx.get_help())
+        raise typer.Exit()
     
-    # Set global config parameters
-    global config_file_path, debug_mode
+    # Set global config parameters; commands load the config on first use
+    global config, config_file_path, debug_mode
+    config = None
     config_file_path = config_file
     debug_mode = debug
 
-    # Initialize config
-    global config
-    config = Config(config_file=config_file, debug=debug)
-
     if debug:
         console.print("[dim]Debug mode enabled[/dim]")
 
@@ -122,6 +158,9 @@ def generate(
         # Disable auto-save
         inkforge generate "Quick Note" --no-auto-save
     """
+    # The generator pulls in the AI client and processors; only load it here
+    from .core.generator import ContentGenerator
+
     try:
         # Parse keywords
         keyword_list = None
@@ -131,21 +170,14 @@ def generate(
         # Parse save formats
         save_format_list = []
         if save_formats and auto_save:
-            format_mapping = {
-                'md': OutputFormat.MARKDOWN,
-                'markdown': OutputFormat.MARKDOWN,
-                'html': OutputFormat.HTML,
-                'json': OutputFormat.JSON,
-                'txt': OutputFormat.PLAIN,
-                'plain': OutputFormat.PLAIN
-            }
-
-            for fmt in save_formats.split(","):
-                fmt = fmt.strip().lower()
-                if fmt in format_mapping:
-                    save_format_list.append(format_mapping[fmt])
-                else:
-                    console.print(f"[yellow]Warning: Unknown format '{fmt}' ignored[/yellow]")
+            names = [fmt.strip().lower() for fmt in save_formats.split(",")]
+            # Keep the requested order, dropping aliases of formats already listed
+            save_format_list = list(dict.fromkeys(
+                SAVE_FORMAT_ALIASES[name] for name in names if name in SAVE_FORMAT_ALIASES
+            ))
+            unknown = [name for name in names if name not in SAVE_FORMAT_ALIASES]
+            if unknown:
+                console.print(f"[yellow]Warning: Unknown formats ignored: {', '.join(unknown)}[/yellow]")
 
         # Interactive mode
         if interactive:
@@ -170,31 +202,39 @@ def generate(
         # Show generation info
         show_generation_info(request)
         
-        # Generate content
-        with console.status("[bold green]Generating content...", spinner="dots"):
-            # Ensure config is properly loaded
-            cfg = get_config()
-            if not cfg.validate_api_key():
-                console.print("[red]❌ API key not configured or invalid[/red]")
-                console.print("[yellow]Please set OPENROUTER_API_KEY environment variable or use 'inkforge config --set openrouter_api_key --value YOUR_KEY'[/yellow]")
-                raise typer.Exit(1)
-
-            generator = ContentGenerator(cfg)
-            response = generator.generate(request, auto_save=auto_save, save_formats=save_format_list)
-
-        # Display results
-        display_results(response, output_format, output_file)
-
-        # Show session info if auto-save is enabled
-        if auto_save:
-            session_summary = generator.get_session_summary()
-            console.print(f"\n[dim]📁 Session: {session_summary['session_id']}[/dim]")
-            console.print(f"[dim]💾 Files saved to: {session_summary['session_dir']}[/dim]")
-            if save_format_list:
-                formats_str = ", ".join([f.value for f in save_format_list])
-                console.print(f"[dim]📄 Formats: {formats_str}[/dim]")
-
-        console.print("\n[bold green]✨ Content generated successfully![/bold green]")
+        # Generate content; the generator is always closed so the session
+        # data is written and background writes finish even on errors
+        generator = None
+        try:
+            with console.status("[bold green]Generating content...", spinner="dots"):
+                # Ensure config is properly loaded
+                cfg = get_config()
+                if not cfg.validate_api_key():
+                    console.print("[red]❌ API key not configured or invalid[/red]")
+                    console.print("[yellow]Please set OPENROUTER_API_KEY environment variable or use 'inkforge config --set openrouter_api_key --value YOUR_KEY'[/yellow]")
+                    raise typer.Exit(1)
+
+                generator = ContentGenerator(cfg)
+                response = generator.generate(request, auto_save=auto_save, save_formats=save_format_list)
+
+            # Buffer the results and write them to the terminal in one go
+            with console:
+                # Display results
+                display_results(response, output_format, output_file)
+
+                # Show session info if auto-save is enabled
+                if auto_save:
+                    session_summary = generator.get_session_summary()
+                    console.print(f"\n[dim]📁 Session: {session_summary['session_id']}[/dim]")
+                    console.print(f"[dim]💾 Files saved to: {session_summary['session_dir']}[/dim]")
+                    if save_format_list:
+                        formats_str = ", ".join([f.value for f in save_format_list])
+                        console.print(f"[dim]📄 Formats: {formats_str}[/dim]")
+
+                console.print("\n[bold green]✨ Content generated successfully![/bold green]")
+        finally:
+            if generator is not None:
+                generator.close()
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Generation cancelled by user.[/yellow]")
@@ -230,8 +270,11 @@ def config_cmd(
     cfg = get_config()
     
     if reset:
+        from rich.prompt import Confirm
+
         if Confirm.ask("Are you sure you want to reset configuration to defaults?"):
             cfg.reset_to_defaults()
+            _build_config.cache_clear()
             console.print("[green]Configuration reset to defaults.[/green]")
         return
     
@@ -264,27 +307,29 @@ def sessions(
         # Clean old sessions
         inkforge sessions --clean
     """
-    try:
-        cfg = get_config()
-        output_dir = Path(cfg.default_output_dir) / "sessions"
+    # Nothing here is interactive, so buffer all output and write it once
+    with console:
+        try:
+            cfg = get_config()
+            output_dir = Path(cfg.default_output_dir) / "sessions"
 
-        if not output_dir.exists():
-            console.print("[yellow]No sessions found.[/yellow]")
-            return
+            if not output_dir.exists():
+                console.print("[yellow]No sessions found.[/yellow]")
+                return
 
-        if clean_old:
-            clean_old_sessions(output_dir)
-            return
+            if clean_old:
+                clean_old_sessions(output_dir)
+                return
 
-        if show_session:
-            show_session_details(output_dir, show_session)
-            return
+            if show_session:
+                show_session_details(output_dir, show_session)
+                return
 
-        if list_sessions or (not show_session and not clean_old):
-            list_recent_sessions(output_dir)
+            if list_sessions or (not show_session and not clean_old):
+                list_recent_sessions(output_dir)
 
-    except Exception as e:
-        console.print(f"[red]Error: {str(e)}[/red]")
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
 
 
 @app.command()
@@ -313,6 +358,9 @@ def templates(
 
 def run_interactive_mode(topic, country, industry, platform, tone, goal, language, keywords, length, custom_instructions):
     """Run interactive configuration mode."""
+    from rich.panel import Panel
+    from rich.prompt import IntPrompt, Prompt
+
     console.print(Panel.fit(
         "[bold blue]🔥 InkForge Interactive Mode[/bold blue]\n"
         "Let's configure your content generation step by step.",
@@ -322,34 +370,35 @@ def run_interactive_mode(topic, country, industry, platform, tone, goal, languag
     # Topic (already provided)
     console.print(f"\n[bold]Topic:[/bold] {topic}")
     
+    # Ask once which sections to customize
+    answer = Prompt.ask(
+        f"What would you like to customize? ({', '.join(INTERACTIVE_SECTIONS)}; comma-separated, empty for none)",
+        default=""
+    )
+    selected = {item.strip().lower() for item in answer.split(",") if item.strip()}
+    unknown = selected.difference(INTERACTIVE_SECTIONS)
+    if unknown:
+        console.print(f"[yellow]Warning: Unknown sections ignored: {', '.join(sorted(unknown))}[/yellow]")
+    
     # Country selection
-    if Confirm.ask("Would you like to change the target country?", default=False):
-        country_options = [c.value for c in Country]
-        country = Country(Prompt.ask("Select country", choices=country_options, default=country.value))
+    if "country" in selected:
+        country = Country(Prompt.ask("Select country", choices=COUNTRY_CHOICES, default=country.value))
     
     # Industry selection
-    if Confirm.ask("Would you like to change the industry?", default=False):
-        industry_options = [i.value for i in Industry]
-        industry = Industry(Prompt.ask("Select industry", choices=industry_options, default=industry.value))
+    if "industry" in selected:
+        industry = Industry(Prompt.ask("Select industry", choices=INDUSTRY_CHOICES, default=industry.value))
     
     # Platform selection
-    if Confirm.ask("Would you like to change the platform?", default=False):
-        platform_options = [p.value for p in Platform]
-        platform = Platform(Prompt.ask("Select platform", choices=platform_options, default=platform.value))
+    if "platform" in selected:
+        platform = Platform(Prompt.ask("Select platform", choices=PLATFORM_CHOICES, default=platform.value))
     
     # Additional options
-    if Confirm.ask("Would you like to customize tone, goal, or other settings?", default=False):
-        tone_options = [t.value for t in Tone]
-        tone = Tone(Prompt.ask("Select tone", choices=tone_options, default=tone.value))
+    if "settings" in selected:
+        tone = Tone(Prompt.ask("Select tone", choices=TONE_CHOICES, default=tone.value))
         
-        goal_options = [g.value for g in Goal]
-        goal = Goal(Prompt.ask("Select goal", choices=goal_options, default=goal.value))
+        goal = Goal(Prompt.ask("Select goal", choices=GOAL_CHOICES, default=goal.value))
         
-        new_length = Prompt.ask("Word count", default=str(length))
-        try:
-            length = int(new_length)
-        except ValueError:
-            pass
+        length = IntPrompt.ask("Word count", default=length)
         
         new_keywords = Prompt.ask("Keywords (comma-separated)", default="")
         if new_keywords:
@@ -360,51 +409,70 @@ def run_interactive_mode(topic, country, industry, platform, tone, goal, languag
     return topic, country, industry, platform, tone, goal, language, keywords, length, custom_instructions
 
 
+def add_plain_rows(table: "Table", rows):
+    """Add rows of plain-text cells to a table, skipping markup parsing."""
+    from rich.text import Text
+
+    for row in rows:
+        table.add_row(*(Text(cell) for cell in row))
+
+
 def show_generation_info(request: ContentRequest):
     """Display generation information."""
+    from rich.table import Table
+
     table = Table(title="Content Generation Settings", show_header=False)
     table.add_column("Setting", style="bold blue")
     table.add_column("Value", style="green")
     
-    table.add_row("Topic", request.topic)
-    table.add_row("Country", request.country.value)
-    table.add_row("Industry", request.industry.value)
-    table.add_row("Platform", request.platform.value)
-    table.add_row("Tone", request.tone.value)
-    table.add_row("Goal", request.goal.value)
-    table.add_row("Language", request.language or "auto")
-    table.add_row("Length", f"~{request.length} words")
-    
+    rows = [
+        ("Topic", request.topic),
+        ("Country", request.country.value),
+        ("Industry", request.industry.value),
+        ("Platform", request.platform.value),
+        ("Tone", request.tone.value),
+        ("Goal", request.goal.value),
+        ("Language", request.language or "auto"),
+        ("Length", f"~{request.length} words"),
+    ]
     if request.keywords:
-        table.add_row("Keywords", ", ".join(request.keywords))
+        rows.append(("Keywords", ", ".join(request.keywords)))
+    add_plain_rows(table, rows)
     
-    console.print(table)
-    console.print()
+    console.print(table, end="\n\n")
 
 
 def display_results(response, output_format: OutputFormat, output_file: Optional[Path]):
     """Display generation results."""
-    # Show title
-    console.print(Panel.fit(
+    from rich.panel import Panel
+    from rich.text import Text
+
+    # Title
+    title_panel = Panel.fit(
         f"[bold blue]{response.title}[/bold blue]",
         border_style="blue",
         title="Generated Title"
-    ))
+    )
     
-    # Show content preview
-    content_preview = response.content[:500] + "..." if len(response.content) > 500 else response.content
-    console.print(Panel(
-        content_preview,
+    # Content preview
+    # Generated text may contain brackets, so it must not be read as markup
+    preview_panel = Panel(
+        Text(response.preview(500)),
         title="Content Preview",
         border_style="green"
-    ))
-    
-    # Show metadata
-    console.print(f"\n[bold]Word Count:[/bold] {response.word_count}")
-    console.print(f"[bold]Estimated Read Time:[/bold] {response.estimated_read_time} minutes")
+    )
     
+    # Metadata, styled directly rather than through markup
+    metadata = Text.assemble(
+        "\n",
+        ("Word Count:", "bold"), f" {response.word_count}\n",
+        ("Estimated Read Time:", "bold"), f" {response.estimated_read_time} minutes",
+    )
     if response.tags:
-        console.print(f"[bold]Suggested Tags:[/bold] {', '.join(response.tags)}")
+        metadata.append_text(Text.assemble("\n", ("Suggested Tags:", "bold"), f" {response.tags_str}"))
+    
+    # Render everything in one pass
+    console.print(Group(title_panel, preview_panel, metadata))
     
     # Save to file if specified
     if output_file:
@@ -414,39 +482,89 @@ def display_results(response, output_format: OutputFormat, output_file: Optional
 
 def save_content(response, output_format: OutputFormat, output_file: Path):
     """Save content to file."""
-    content = response.content
-    
+    # Write the pieces in turn rather than concatenating a second copy of the body
     if output_format == OutputFormat.HTML:
-        content = f"<h1>{response.title}</h1>\n\n{content.replace(chr(10), '<br>')}"
+        parts = ["<h1>", response.title, "</h1>\n\n", response.content.replace("\n", "<br>")]
     elif output_format == OutputFormat.JSON:
-        import json
-        content = json.dumps(response.dict(), indent=2, ensure_ascii=False)
+        parts = [response.model_dump_json(indent=2)]
+    else:
+        parts = [response.content]
     
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(content, encoding='utf-8')
+    write_atomic(output_file, (part.encode('utf-8') for part in parts))
+
+
+def load_session_summaries(output_dir: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """Load a summary of every session, re-reading only sessions changed since the last call."""
+    index_file = output_dir / SESSIONS_INDEX_FILE
+    try:
+        index = jsonutil.loads(index_file.read_bytes())
+    except (OSError, ValueError):
+        index = {}
+
+    # Read the directory entries first so index updates below don't affect the scan
+    with os.scandir(output_dir) as it:
+        session_entries = [entry for entry in it if entry.is_dir()]
+
+    summaries = {}
+    stale = []
+    for entry in session_entries:
+        mtime_ns = session_mtime_ns(entry.path)
+        if mtime_ns is None:
+            continue
+
+        cached = index.get(entry.name)
+        if cached is not None and cached.get("mtime_ns") == mtime_ns:
+            summaries[entry.name] = cached
+        else:
+            stale.append((entry.name, entry.path, mtime_ns))
+
+    # Re-read changed sessions concurrently; the reads are I/O bound
+    if stale:
+        names, session_dirs, mtimes = zip(*stale)
+        with ThreadPoolExecutor(max_workers=min(SESSION_LOAD_WORKERS, len(stale))) as pool:
+            for name, summary in zip(names, pool.map(summarize_session, session_dirs, mtimes)):
+                if summary is not None:
+                    summaries[name] = summary
+
+    # Rewrite the index atomically; sessions that no longer exist drop out
+    if summaries != index:
+        try:
+            write_atomic(index_file, [jsonutil.dumps(summaries).encode('utf-8')])
+        except OSError:
+            pass
+
+    return list(summaries.items())
+
+
+def summarize_session(session_dir: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Summarize one session, or return None if it cannot be read."""
+    try:
+        session_data = read_session_data(session_dir)
+    except (OSError, ValueError):
+        return None
+
+    generations = session_data.get("generations", [])
+    return {
+        "mtime_ns": mtime_ns,
+        "start_time": session_data.get("start_time", ""),
+        "total": len(generations),
+        "successful": sum(1 for g in generations if g.get("success", False)),
+    }
 
 
 def list_recent_sessions(output_dir: Path):
     """List recent sessions."""
-    sessions = []
-
-    for session_dir in output_dir.iterdir():
-        if session_dir.is_dir():
-            session_file = session_dir / "session_data.json"
-            if session_file.exists():
-                try:
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-                    sessions.append((session_dir.name, session_data))
-                except:
-                    continue
+    from rich.table import Table
+
+    sessions = load_session_summaries(output_dir)
 
     if not sessions:
         console.print("[yellow]No sessions found.[/yellow]")
         return
 
     # Sort by start time (newest first)
-    sessions.sort(key=lambda x: x[1].get("start_time", ""), reverse=True)
+    sessions.sort(key=lambda x: x[1]["start_time"], reverse=True)
 
     table = Table(title="Recent Sessions")
     table.add_column("Session ID", style="bold blue")
@@ -454,19 +572,15 @@ def list_recent_sessions(output_dir: Path):
     table.add_column("Generations", style="cyan")
     table.add_column("Success Rate", style="yellow")
 
-    for session_id, data in sessions[:10]:  # Show last 10 sessions
-        total = len(data.get("generations", []))
-        successful = sum(1 for g in data.get("generations", []) if g.get("success", False))
+    for session_id, summary in sessions[:10]:  # Show last 10 sessions
+        total = summary["total"]
+        successful = summary["successful"]
         success_rate = f"{successful}/{total}" if total > 0 else "0/0"
 
-        start_time = data.get("start_time", "Unknown")
-        if start_time != "Unknown":
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                start_time = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                pass
+        # ISO timestamps are fixed-width: "YYYY-MM-DDTHH:MM..." -> "YYYY-MM-DD HH:MM"
+        start_time = summary["start_time"] or "Unknown"
+        if len(start_time) >= 16 and start_time[10] == "T":
+            start_time = f"{start_time[:10]} {start_time[11:16]}"
 
         table.add_row(session_id, start_time, str(total), success_rate)
 
@@ -475,27 +589,29 @@ def list_recent_sessions(output_dir: Path):
 
 def show_session_details(output_dir: Path, session_id: str):
     """Show details of a specific session."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     session_dir = output_dir / session_id
-    session_file = session_dir / "session_data.json"
 
-    if not session_file.exists():
+    if session_mtime_ns(session_dir) is None:
         console.print(f"[red]Session {session_id} not found.[/red]")
         return
 
     try:
-        with open(session_file, 'r', encoding='utf-8') as f:
-            session_data = json.load(f)
+        session_data = read_session_data(session_dir)
     except Exception as e:
         console.print(f"[red]Error reading session data: {e}[/red]")
         return
 
     # Session info
-    console.print(Panel.fit(
+    session_panel = Panel.fit(
         f"[bold blue]Session: {session_id}[/bold blue]\n"
         f"Start Time: {session_data.get('start_time', 'Unknown')}\n"
         f"Directory: {session_dir}",
         border_style="blue"
-    ))
+    )
 
     # Generations
     generations = session_data.get("generations", [])
@@ -507,22 +623,20 @@ def show_session_details(output_dir: Path, session_id: str):
         table.add_column("Word Count", style="yellow")
         table.add_column("Formats", style="dim")
 
-        for gen in generations:
-            status = "✅ Success" if gen.get("success", False) else "❌ Failed"
-            word_count = str(gen.get("word_count", "N/A"))
-            formats = ", ".join(gen.get("formats_saved", []))
-
-            table.add_row(
+        add_plain_rows(table, (
+            (
                 gen.get("generation_id", "Unknown"),
                 gen.get("topic", "Unknown")[:50],
-                status,
-                word_count,
-                formats
+                "✅ Success" if gen.get("success", False) else "❌ Failed",
+                str(gen.get("word_count", "N/A")),
+                ", ".join(gen.get("formats_saved", [])),
             )
+            for gen in generations
+        ))
 
-        console.print(table)
+        console.print(Group(session_panel, table))
     else:
-        console.print("[yellow]No generations in this session.[/yellow]")
+        console.print(Group(session_panel, Text("No generations in this session.", style="yellow")))
 
 
 def clean_old_sessions(output_dir: Path):
@@ -530,42 +644,48 @@ def clean_old_sessions(output_dir: Path):
     import shutil
     from datetime import datetime, timedelta
 
-    cutoff_date = datetime.now() - timedelta(days=7)
+    # Session IDs start with YYYYMMDD, so dates compare correctly as strings.
+    # A session dated on the cutoff day started before the cutoff time.
+    cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
     cleaned_count = 0
 
-    for session_dir in output_dir.iterdir():
-        if session_dir.is_dir():
-            try:
-                # Parse session ID to get date
-                session_id = session_dir.name
-                if len(session_id) >= 8:
-                    date_part = session_id[:8]  # YYYYMMDD
-                    session_date = datetime.strptime(date_part, "%Y%m%d")
-
-                    if session_date < cutoff_date:
-                        shutil.rmtree(session_dir)
-                        cleaned_count += 1
-                        console.print(f"[dim]Cleaned session: {session_id}[/dim]")
-            except:
-                continue
+    with os.scandir(output_dir) as it:
+        session_entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+
+    for entry in session_entries:
+        session_id = entry.name
+        date_part = session_id[:8]  # YYYYMMDD
+        if len(date_part) < 8 or not date_part.isdigit() or date_part > cutoff:
+            continue
+
+        try:
+            shutil.rmtree(entry.path)
+        except OSError:
+            continue
+        cleaned_count += 1
+        console.print(f"[dim]Cleaned session: {session_id}[/dim]")
 
     console.print(f"[green]Cleaned {cleaned_count} old sessions.[/green]")
 
 
 def show_config(cfg: Config):
     """Display current configuration."""
+    from rich.table import Table
+
     table = Table(title="InkForge Configuration")
     table.add_column("Setting", style="bold blue")
     table.add_column("Value", style="green")
     table.add_column("Description", style="dim")
 
     # Add configuration rows
-    table.add_row("API Key", "***" if cfg.openrouter_api_key else "Not set", "OpenRouter API key")
-    table.add_row("Default Model", cfg.default_model, "Default AI model")
-    table.add_row("Default Country", cfg.default_country, "Default target country")
-    table.add_row("Default Industry", cfg.default_industry, "Default industry")
-    table.add_row("Default Platform", cfg.default_platform, "Default platform")
-    table.add_row("Output Directory", cfg.default_output_dir, "Default output directory")
+    add_plain_rows(table, [
+        ("API Key", "***" if cfg.openrouter_api_key else "Not set", "OpenRouter API key"),
+        ("Default Model", cfg.default_model, "Default AI model"),
+        ("Default Country", cfg.default_country, "Default target country"),
+        ("Default Industry", cfg.default_industry, "Default industry"),
+        ("Default Platform", cfg.default_platform, "Default platform"),
+        ("Output Directory", cfg.default_output_dir, "Default output directory"),
+    ])
 
     console.print(table)
 
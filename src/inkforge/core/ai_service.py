@@ -1,13 +1,255 @@
 """AI service integration for InkForge."""
 
-import json
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+import functools
+import random
+import re
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Coroutine, Dict, FrozenSet, List, Optional, Any, Sequence, Tuple, TypeVar, Union
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .config import Config
+from .llm_cache import ResponseCache
 from ..models.content import GenerationConfig
+from ..utils import jsonutil
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Connection pool and timeouts shared by all OpenRouter requests
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0)
+
+# Transient responses retried in place before surfacing an error
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+TRANSIENT_RETRIES = 2
+TRANSIENT_BACKOFF_BASE = 0.5
+RETRY_AFTER_MAX = 30.0
+
+# How long validate_model trusts a fetched model list, in seconds
+MODEL_LIST_TTL = 600.0
+
+# Model prefixes that need explicit cache_control markers for prompt caching
+CACHE_CONTROL_PREFIXES = ("anthropic/",)
+
+# Shared defaults for calls made without a generation config
+_DEFAULT_GEN_CONFIG = GenerationConfig()
+
+# Process-wide cache for deterministic (temperature 0) responses
+DEFAULT_RESPONSE_CACHE = ResponseCache()
+
+# Demo mode: the topic is the first quoted string in the prompt
+_TOPIC_RE = re.compile(r'"([^"]+)"')
+
+# Demo mode: packed batch prompts get one answer per question block
+_QUESTION_RE = re.compile(r'<question id=(\d+)>(.*?)</question>', re.DOTALL)
+
+_DEMO_TEMPLATE = """# {topic}: A Comprehensive Guide
+
+## Introduction
+
+{topic} is an increasingly important topic in today's digital landscape. This comprehensive guide will explore the key aspects, benefits, and practical applications.
+
+## Key Points
+
+### Understanding the Basics
+The fundamental concepts behind {topic_lower} are essential for anyone looking to stay current with modern trends and technologies.
+
+### Practical Applications
+There are numerous ways to apply these concepts in real-world scenarios:
+
+1. **Professional Development**: Enhancing skills and knowledge
+2. **Business Innovation**: Driving growth and efficiency
+3. **Personal Growth**: Expanding understanding and capabilities
+
+### Benefits and Advantages
+The advantages of understanding {topic_lower} include:
+- Improved decision-making capabilities
+- Enhanced problem-solving skills
+- Better adaptation to changing environments
+- Increased opportunities for growth
+
+## Implementation Strategies
+
+### Getting Started
+Begin by focusing on the fundamentals and gradually building expertise through practice and continuous learning.
+
+### Best Practices
+- Stay updated with latest developments
+- Engage with community and experts
+- Apply knowledge through practical projects
+- Seek feedback and iterate
+
+## Future Outlook
+
+The future of {topic_lower} looks promising, with continued innovation and development expected in the coming years.
+
+## Conclusion
+
+{topic} represents a significant opportunity for growth and development. By understanding the key concepts and implementing best practices, individuals and organizations can harness its full potential.
+
+What are your thoughts on {topic_lower}? Share your experiences and insights!
+
+Tags: {topic_slug}, technology, innovation, future
+Engagement Tips: Ask readers about their experiences, Share practical examples, Encourage discussion in comments"""
+
+
+T = TypeVar("T")
+
+# Background event loop used by the *_sync wrappers, started on first use
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared background loop and wait for its result.
+
+    Reusing one loop keeps the HTTP client's pooled connections alive
+    between synchronous calls instead of tearing them down each time.
+    """
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="inkforge-sync", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop).result()
+
+
+# Pooled clients per event loop, keyed by base URL and headers, with reference counts
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, List[Any]]]" = weakref.WeakKeyDictionary()
+
+
+def _new_client(headers: httpx.Headers) -> httpx.AsyncClient:
+    """Create an HTTP client; HTTP/2 multiplexes concurrent requests on one connection."""
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        limits=HTTP_LIMITS,
+        headers=headers,
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+def _acquire_client(
+    base_url: str,
+    headers: httpx.Headers,
+) -> Tuple[httpx.AsyncClient, Optional[asyncio.AbstractEventLoop]]:
+    """Get a client for the running event loop, sharing it between services.
+
+    httpx connections belong to the loop that opened them, so clients are only
+    shared within a loop. Outside a running loop a private client is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _new_client(headers), None
+
+    clients = _shared_clients.setdefault(loop, {})
+    key = (base_url, tuple(sorted(headers.items())))
+    entry = clients.get(key)
+    if entry is None or entry[0].is_closed:
+        entry = clients[key] = [_new_client(headers), 0]
+    entry[1] += 1
+    return entry[0], loop
+
+
+def _release_client(
+    loop: asyncio.AbstractEventLoop,
+    base_url: str,
+    headers: httpx.Headers,
+    client: httpx.AsyncClient,
+) -> bool:
+    """Drop one reference to a shared client; return True if it should be closed.
+
+    A client that is no longer the shared one for its key belongs only to the
+    caller, so it is closed without touching the shared entry.
+    """
+    clients = _shared_clients.get(loop, {})
+    key = (base_url, tuple(sorted(headers.items())))
+    entry = clients.get(key)
+    if entry is None or entry[0] is not client:
+        return True
+    entry[1] -= 1
+    if entry[1] > 0:
+        return False
+    del clients[key]
+    return True
+
+
+@functools.lru_cache(maxsize=32)
+def _payload_prefix(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    top_p: float,
+    frequency_penalty: float,
+    presence_penalty: float,
+) -> bytes:
+    """Encode the sampling parameters as an unterminated JSON object.
+
+    These are identical across requests made with the same generation config,
+    so they are serialized once and the messages are appended per request.
+    """
+    params = jsonutil.dumps({
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "top_p": top_p,
+        "frequency_penalty": frequency_penalty,
+        "presence_penalty": presence_penalty,
+    })
+    return params[:-1].encode("utf-8")
+
+
+def _demo_text(prompt: str) -> str:
+    """Render demo content for the topic found in a prompt."""
+    topic_match = _TOPIC_RE.search(prompt)
+    topic = topic_match.group(1) if topic_match else "AI and Technology"
+    topic_lower = topic.lower()
+    return _DEMO_TEMPLATE.format_map({
+        "topic": topic,
+        "topic_lower": topic_lower,
+        "topic_slug": topic_lower.replace(' ', '-'),
+    })
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, defaulting to cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count prompt tokens, or estimate them from words without tiktoken."""
+    if tiktoken is not None:
+        return len(_get_encoding(model).encode(text))
+    return int(len(text.split()) * 1.3)
+
+
+def _transient_delay(response: httpx.Response, attempt: int) -> float:
+    """Get the wait before retrying a transient error, preferring Retry-After."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    delay = TRANSIENT_BACKOFF_BASE * 2 ** attempt
+    return random.uniform(delay / 2, delay)
 
 
 class AIResponse(BaseModel):
@@ -16,23 +258,29 @@ class AIResponse(BaseModel):
     model: str
     usage: Dict[str, int]
     finish_reason: str
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class AIService:
     """AI service client for OpenRouter API."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache: Optional[ResponseCache] = None):
         """Initialize AI service."""
         self.config = config
+        self.cache = cache if cache is not None else DEFAULT_RESPONSE_CACHE
         self.base_url = config.openrouter_base_url.rstrip('/')
-        self.headers = config.get_headers()
+        self.headers = httpx.Headers(config.get_headers())
+        self._chat_url = f"{self.base_url}/chat/completions"
+        self._models_url = f"{self.base_url}/models"
         
-        # HTTP client configuration
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0),
-            headers=self.headers,
-        )
+        # HTTP client, shared with other services on the same event loop
+        self.client, self._client_loop = _acquire_client(self.base_url, self.headers)
+        self._released = False
+
+        # Model list from the last /models response, revalidated by ETag
+        self._models: Optional[List[Dict[str, Any]]] = None
+        self._models_etag: Optional[str] = None
+        self._model_ids: Optional[Tuple[float, FrozenSet[str]]] = None
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -40,46 +288,71 @@ class AIService:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.aclose()
+
+    async def aclose(self):
+        """Release the HTTP client, closing it once no other service uses it.
+
+        Calling this again is a no-op, so a service never drops another
+        service's reference to the shared client.
+        """
+        if self._released:
+            return
+        self._released = True
+        if self._client_loop is None or _release_client(self._client_loop, self.base_url, self.headers, self.client):
+            await self.client.aclose()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get picklable state; the HTTP client is recreated on unpickling."""
+        state = self.__dict__.copy()
+        del state["client"], state["_client_loop"], state["_released"]
+        if self.cache is DEFAULT_RESPONSE_CACHE:
+            state["cache"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore state and attach an HTTP client."""
+        self.__dict__.update(state)
+        if self.cache is None:
+            self.cache = DEFAULT_RESPONSE_CACHE
+        self.client, self._client_loop = _acquire_client(self.base_url, self.headers)
+        self._released = False
     
     async def generate_content(
         self,
         prompt: str,
         generation_config: Optional[GenerationConfig] = None
     ) -> AIResponse:
-        """Generate content using AI model."""
+        """Generate content using AI model.
+
+        Static instructions belong in ``generation_config.system_prompt`` and
+        per-request text in ``prompt`` so the provider can cache the prefix.
+        """
         if generation_config is None:
-            generation_config = GenerationConfig()
+            generation_config = _DEFAULT_GEN_CONFIG
 
         # Check for demo mode (invalid API key)
-        if not self.config.validate_api_key() or self.config.openrouter_api_key == "demo-mode":
+        if self._is_demo_mode():
             return self._generate_demo_content(prompt, generation_config)
 
         # Prepare request payload
-        payload = {
-            "model": generation_config.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": generation_config.temperature,
-            "max_tokens": generation_config.max_tokens,
-            "top_p": generation_config.top_p,
-            "frequency_penalty": generation_config.frequency_penalty,
-            "presence_penalty": generation_config.presence_penalty,
-            "stream": False,
-        }
+        payload = self._build_payload(prompt, generation_config, stream=False)
+
+        # Only deterministic requests can be answered from the cache
+        cache_key = None
+        if generation_config.temperature == 0:
+            cache_key = self.cache.make_key(payload)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                metadata = {**cached["metadata"], "cache_hit": True}
+                return AIResponse.model_construct(**{**cached, "metadata": metadata})
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
+            started = time.monotonic()
+            response = await self._post_with_retry(self._chat_url, payload)
+            response_time = time.monotonic() - started
 
-            data = response.json()
+            data = jsonutil.loads(response.content)
 
             # Extract response data
             choice = data["choices"][0]
@@ -87,28 +360,32 @@ class AIService:
             finish_reason = choice.get("finish_reason", "stop")
             usage = data.get("usage", {})
 
-            return AIResponse(
+            ai_response = AIResponse.model_construct(
                 content=content,
                 model=data.get("model", generation_config.model),
                 usage=usage,
                 finish_reason=finish_reason,
                 metadata={
-                    "response_time": response.elapsed.total_seconds(),
+                    "response_time": response_time,
                     "status_code": response.status_code,
                 }
             )
+            if cache_key is not None:
+                self.cache.set(cache_key, ai_response.model_dump())
+            return ai_response
 
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
-                error_data = e.response.json()
+                error_data = jsonutil.loads(e.response.content)
                 error_detail = error_data.get("error", {}).get("message", str(e))
 
                 # If it's an auth error, fall back to demo mode
                 if "auth" in error_detail.lower() or e.response.status_code == 401:
                     return self._generate_demo_content(prompt, generation_config)
 
-            except:
+            except (ValueError, AttributeError):
+                # Error body is not JSON or not in the usual {"error": {...}} shape
                 error_detail = str(e)
 
             raise AIServiceError(f"API request failed: {error_detail}") from e
@@ -119,68 +396,115 @@ class AIService:
         except Exception as e:
             raise AIServiceError(f"Unexpected error: {str(e)}") from e
 
-    def _generate_demo_content(self, prompt: str, generation_config: GenerationConfig) -> AIResponse:
-        """Generate demo content when API is not available."""
-        import re
-
-        # Extract topic from prompt
-        topic_match = re.search(r'"([^"]+)"', prompt)
-        topic = topic_match.group(1) if topic_match else "AI and Technology"
-
-        # Generate demo content based on topic
-        demo_content = f"""# {topic}: A Comprehensive Guide
-
-## Introduction
-
-{topic} is an increasingly important topic in today's digital landscape. This comprehensive guide will explore the key aspects, benefits, and practical applications.
-
-## Key Points
-
-### Understanding the Basics
-The fundamental concepts behind {topic.lower()} are essential for anyone looking to stay current with modern trends and technologies.
-
-### Practical Applications
-There are numerous ways to apply these concepts in real-world scenarios:
-
-1. **Professional Development**: Enhancing skills and knowledge
-2. **Business Innovation**: Driving growth and efficiency
-3. **Personal Growth**: Expanding understanding and capabilities
-
-### Benefits and Advantages
-The advantages of understanding {topic.lower()} include:
-- Improved decision-making capabilities
-- Enhanced problem-solving skills
-- Better adaptation to changing environments
-- Increased opportunities for growth
-
-## Implementation Strategies
-
-### Getting Started
-Begin by focusing on the fundamentals and gradually building expertise through practice and continuous learning.
+    async def generate_content_stream(
+        self,
+        prompt: str,
+        generation_config: Optional[GenerationConfig] = None
+    ) -> AsyncIterator[str]:
+        """Generate content using AI model, yielding text chunks as they arrive."""
+        if generation_config is None:
+            generation_config = _DEFAULT_GEN_CONFIG
 
-### Best Practices
-- Stay updated with latest developments
-- Engage with community and experts
-- Apply knowledge through practical projects
-- Seek feedback and iterate
+        if self._is_demo_mode():
+            demo_response = self._generate_demo_content(prompt, generation_config)
+            for line in demo_response.content.splitlines(keepends=True):
+                yield line
+            return
 
-## Future Outlook
+        payload = self._build_payload(prompt, generation_config, stream=True)
 
-The future of {topic.lower()} looks promising, with continued innovation and development expected in the coming years.
+        try:
+            async with self.client.stream(
+                "POST",
+                self._chat_url,
+                content=payload
+            ) as response:
+                response.raise_for_status()
+
+                # Server-sent events: one "data: {...}" line per chunk
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = jsonutil.loads(data)
+                    choices = chunk.get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
 
-## Conclusion
+        except httpx.HTTPStatusError as e:
+            raise AIServiceError(f"API request failed: {str(e)}") from e
 
-{topic} represents a significant opportunity for growth and development. By understanding the key concepts and implementing best practices, individuals and organizations can harness its full potential.
+        except httpx.RequestError as e:
+            raise AIServiceError(f"Network error: {str(e)}") from e
 
-What are your thoughts on {topic.lower()}? Share your experiences and insights!
+    async def _post_with_retry(self, url: str, content: bytes) -> httpx.Response:
+        """POST a request, retrying rate-limit and server errors with backoff."""
+        for attempt in range(TRANSIENT_RETRIES + 1):
+            response = await self.client.post(url, content=content)
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == TRANSIENT_RETRIES:
+                response.raise_for_status()
+                return response
+            await asyncio.sleep(_transient_delay(response, attempt))
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get response cache statistics."""
+        return self.cache.stats
+
+    def _is_demo_mode(self) -> bool:
+        """Check whether generation should fall back to demo content."""
+        return not self.config.validate_api_key() or self.config.openrouter_api_key == "demo-mode"
+
+    def _build_payload(self, prompt: str, generation_config: GenerationConfig, stream: bool) -> bytes:
+        """Build the JSON-encoded chat completions request body."""
+        messages = []
+        if generation_config.system_prompt:
+            system_message: Dict[str, Any] = {"role": "system", "content": generation_config.system_prompt}
+            if generation_config.model.startswith(CACHE_CONTROL_PREFIXES):
+                system_message["content"] = [{
+                    "type": "text",
+                    "text": generation_config.system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }]
+            messages.append(system_message)
+        messages.append({"role": "user", "content": prompt})
+
+        prefix = _payload_prefix(
+            generation_config.model,
+            generation_config.temperature,
+            generation_config.max_tokens,
+            generation_config.top_p,
+            generation_config.frequency_penalty,
+            generation_config.presence_penalty,
+        )
+        return b"".join((
+            prefix,
+            b',"messages":',
+            jsonutil.dumps(messages).encode("utf-8"),
+            b',"stream":true}' if stream else b',"stream":false}',
+        ))
 
-Tags: {topic.lower().replace(' ', '-')}, technology, innovation, future
-Engagement Tips: Ask readers about their experiences, Share practical examples, Encourage discussion in comments"""
+    def _generate_demo_content(self, prompt: str, generation_config: GenerationConfig) -> AIResponse:
+        """Generate demo content when API is not available."""
+        questions = _QUESTION_RE.findall(prompt)
+        if questions:
+            demo_content = "\n\n".join(
+                f"<answer id={question_id}>\n{_demo_text(question)}\n</answer>"
+                for question_id, question in questions
+            )
+        else:
+            demo_content = _demo_text(prompt)
+        prompt_tokens = len(prompt.split())
+        completion_tokens = len(demo_content.split())
 
-        return AIResponse(
+        return AIResponse.model_construct(
             content=demo_content,
             model=generation_config.model + " (demo)",
-            usage={"prompt_tokens": len(prompt.split()), "completion_tokens": len(demo_content.split()), "total_tokens": len(prompt.split()) + len(demo_content.split())},
+            usage={"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens},
             finish_reason="stop",
             metadata={
                 "response_time": 1.0,
@@ -195,37 +519,81 @@ Engagement Tips: Ask readers about their experiences, Share practical examples,
         generation_config: Optional[GenerationConfig] = None
     ) -> AIResponse:
         """Synchronous wrapper for content generation."""
-        return asyncio.run(self.generate_content(prompt, generation_config))
+        return _run_sync(self.generate_content(prompt, generation_config))
+    
+    async def generate_content_batch(
+        self,
+        prompts: Sequence[str],
+        generation_config: Optional[GenerationConfig] = None,
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> List[Union[AIResponse, BaseException]]:
+        """Generate content for several prompts concurrently, in prompt order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(prompt: str) -> AIResponse:
+            async with semaphore:
+                return await self.generate_content(prompt, generation_config)
+
+        return await asyncio.gather(
+            *[run(prompt) for prompt in prompts],
+            return_exceptions=return_exceptions,
+        )
+
+    def generate_content_batch_sync(
+        self,
+        prompts: Sequence[str],
+        generation_config: Optional[GenerationConfig] = None,
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> List[Union[AIResponse, BaseException]]:
+        """Synchronous wrapper for batch content generation."""
+        return _run_sync(self.generate_content_batch(prompts, generation_config, max_concurrency, return_exceptions))
     
     async def get_available_models(self) -> List[Dict[str, Any]]:
         """Get list of available models."""
         try:
-            response = await self.client.get(f"{self.base_url}/models")
+            headers = {}
+            if self._models is not None and self._models_etag:
+                headers["If-None-Match"] = self._models_etag
+
+            response = await self.client.get(self._models_url, headers=headers)
+            if response.status_code == 304 and self._models is not None:
+                return self._models
             response.raise_for_status()
             
-            data = response.json()
-            return data.get("data", [])
+            data = jsonutil.loads(response.content)
+            models = data.get("data", [])
+            if not isinstance(models, list) or not all(
+                isinstance(model, dict) and isinstance(model.get("id"), str) for model in models
+            ):
+                raise ValueError("unexpected /models response format")
+
+            self._models = models
+            self._models_etag = response.headers.get("ETag")
+            return models
             
         except Exception as e:
             raise AIServiceError(f"Failed to get models: {str(e)}") from e
     
     def get_available_models_sync(self) -> List[Dict[str, Any]]:
         """Synchronous wrapper for getting available models."""
-        return asyncio.run(self.get_available_models())
+        return _run_sync(self.get_available_models())
     
     async def validate_model(self, model_name: str) -> bool:
         """Validate if a model is available."""
         try:
-            models = await self.get_available_models()
-            available_model_ids = [model.get("id", "") for model in models]
-            return model_name in available_model_ids
-        except:
+            if self._model_ids is None or time.monotonic() - self._model_ids[0] > MODEL_LIST_TTL:
+                models = await self.get_available_models()
+                self._model_ids = (time.monotonic(), frozenset(model["id"] for model in models))
+            return model_name in self._model_ids[1]
+        except AIServiceError:
             # If we can't get models list, assume the model is valid
             return True
     
     def validate_model_sync(self, model_name: str) -> bool:
         """Synchronous wrapper for model validation."""
-        return asyncio.run(self.validate_model(model_name))
+        return _run_sync(self.validate_model(model_name))
     
     async def estimate_cost(
         self,
@@ -234,16 +602,15 @@ Engagement Tips: Ask readers about their experiences, Share practical examples,
     ) -> Dict[str, Any]:
         """Estimate the cost of generation (if supported by the API)."""
         if generation_config is None:
-            generation_config = GenerationConfig()
+            generation_config = _DEFAULT_GEN_CONFIG
         
-        # Simple token estimation (rough approximation)
-        prompt_tokens = len(prompt.split()) * 1.3  # Rough token estimation
+        prompt_tokens = _count_tokens(prompt, generation_config.model)
         max_completion_tokens = generation_config.max_tokens
         
         return {
-            "estimated_prompt_tokens": int(prompt_tokens),
+            "estimated_prompt_tokens": prompt_tokens,
             "max_completion_tokens": max_completion_tokens,
-            "total_max_tokens": int(prompt_tokens + max_completion_tokens),
+            "total_max_tokens": prompt_tokens + max_completion_tokens,
             "model": generation_config.model,
             "note": "This is a rough estimation. Actual costs may vary."
         }
@@ -254,7 +621,7 @@ Engagement Tips: Ask readers about their experiences, Share practical examples,
         generation_config: Optional[GenerationConfig] = None
     ) -> Dict[str, Any]:
         """Synchronous wrapper for cost estimation."""
-        return asyncio.run(self.estimate_cost(prompt, generation_config))
+        return _run_sync(self.estimate_cost(prompt, generation_config))
 
 
 class AIServiceError(Exception):
@@ -268,18 +635,34 @@ class AIServiceManager:
     def __init__(self, config: Config):
         """Initialize AI service manager."""
         self.config = config
+        # Services hold loop-bound HTTP clients, so each event loop gets its
+        # own; ``_service`` is the one created outside a running loop
         self._service: Optional[AIService] = None
+        self._loop_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AIService]" = weakref.WeakKeyDictionary()
     
     def get_service(self) -> AIService:
-        """Get AI service instance."""
-        if self._service is None:
-            self._service = AIService(self.config)
-        return self._service
+        """Get the AI service for the running event loop, or the loop-less one outside a loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self._service is None:
+                self._service = AIService(self.config)
+            return self._service
+
+        service = self._loop_services.get(loop)
+        if service is None:
+            service = self._loop_services[loop] = AIService(self.config)
+        return service
     
     async def get_async_service(self) -> AIService:
-        """Get async AI service instance."""
-        service = AIService(self.config)
-        return service
+        """Get the AI service for the running event loop."""
+        return self.get_service()
+
+    async def aclose(self):
+        """Close the AI service of the running event loop, if one was created."""
+        service = self._loop_services.pop(asyncio.get_running_loop(), None)
+        if service is not None:
+            await service.aclose()
     
     def validate_configuration(self) -> bool:
         """Validate AI service configuration."""
@@ -298,25 +681,26 @@ class AIServiceManager:
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to AI service."""
         try:
-            async with AIService(self.config) as service:
-                # Try a simple generation
-                test_prompt = "Say 'Hello, InkForge!' in a friendly way."
-                config = GenerationConfig(
-                    model=self.config.default_model,
-                    max_tokens=50,
-                    temperature=0.1
-                )
-                
-                response = await service.generate_content(test_prompt, config)
-                
-                return {
-                    "success": True,
-                    "model": response.model,
-                    "response_time": response.metadata.get("response_time", 0),
-                    "usage": response.usage,
-                    "test_response": response.content[:100] + "..." if len(response.content) > 100 else response.content
-                }
-                
+            service = self.get_service()
+
+            # Try a simple generation
+            test_prompt = "Say 'Hello, InkForge!' in a friendly way."
+            config = GenerationConfig(
+                model=self.config.default_model,
+                max_tokens=50,
+                temperature=0.1
+            )
+            
+            response = await service.generate_content(test_prompt, config)
+            
+            return {
+                "success": True,
+                "model": response.model,
+                "response_time": response.metadata.get("response_time", 0),
+                "usage": response.usage,
+                "test_response": response.content[:100] + "..." if len(response.content) > 100 else response.content
+            }
+            
         except Exception as e:
             return {
                 "success": False,
@@ -326,4 +710,4 @@ class AIServiceManager:
     
     def test_connection_sync(self) -> Dict[str, Any]:
         """Synchronous wrapper for connection test."""
-        return asyncio.run(self.test_connection())
+        return _run_sync(self.test_connection())
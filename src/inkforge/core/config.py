@@ -1,13 +1,136 @@
 """Configuration management for InkForge."""
 
+import functools
 import os
-import json
 import toml
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, Iterator, Optional, Set, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..models.content import Country, Industry, Platform, Tone, Goal, OutputFormat
+from ..utils import jsonutil
+from ..utils.fileio import write_atomic
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import tomli_w
+except ImportError:
+    tomli_w = None
+
+
+# Parsed config files keyed by (path, mtime_ns, size), most recently used last
+_PARSED_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+PARSED_CACHE_SIZE = 32
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable as a boolean flag."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Fields settable from an environment variable of the same name in upper case
+_ENV_FIELD_NAMES = (
+    'openrouter_api_key',
+    'openrouter_base_url',
+    'default_model',
+    'default_country',
+    'default_industry',
+    'default_platform',
+    'default_tone',
+    'default_goal',
+    'default_output_format',
+    'default_output_dir',
+    'max_content_length',
+    'min_content_length',
+    'temperature',
+    'max_tokens',
+    'top_p',
+    'frequency_penalty',
+    'presence_penalty',
+    'min_quality_score',
+    'debug',
+    'log_level',
+)
+
+# Env var parsers by field type; anything else is kept as a string
+_ENV_CONVERTERS = {bool: _to_bool, int: int, float: float}
+
+# Valid enum values for the default_* validators
+_COUNTRY_VALUES = frozenset(country.value for country in Country)
+_INDUSTRY_VALUES = frozenset(industry.value for industry in Industry)
+_PLATFORM_VALUES = frozenset(platform.value for platform in Platform)
+
+# Whether the working directory's .env file has been checked
+_DOTENV_LOADED = False
+
+# Default config file names, in priority order
+CWD_CONFIG_NAMES = ("inkforge.toml", "inkforge.json", ".inkforge.toml", ".inkforge.json")
+HOME_CONFIG_NAMES = ("config.toml", "config.json")
+
+
+def _read_toml(path: Path) -> Dict[str, Any]:
+    """Parse a TOML file, preferring tomllib/tomli over the toml package."""
+    if tomllib is not None:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    return toml.load(path)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Parse a JSON file."""
+    return jsonutil.loads(path.read_bytes())
+
+
+# Config file parsers by suffix
+_CONFIG_LOADERS = {
+    '.json': _read_json,
+    '.toml': _read_toml,
+    '.tml': _read_toml,
+}
+
+
+def _existing_files(directory: Path, names: Tuple[str, ...]) -> Set[str]:
+    """Get which of the given file names exist in a directory, in one listing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name in names and entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _dump_toml(data: Dict[str, Any]) -> str:
+    """Serialize to TOML, preferring tomli-w over the toml package."""
+    # TOML has no null; unset values are simply omitted
+    data = {key: value for key, value in data.items() if value is not None}
+    if tomli_w is not None:
+        return tomli_w.dumps(data)
+    return toml.dumps(data)
+
+
+@functools.lru_cache(maxsize=4)
+def _find_default_config(cwd: str, home: str) -> Optional[Path]:
+    """Find the default config file for a working and home directory.
+
+    Cached per process; save() clears the cache when it writes a new file.
+    """
+    for directory, names in (
+        (Path(cwd), CWD_CONFIG_NAMES),
+        (Path(home) / ".inkforge", HOME_CONFIG_NAMES),
+    ):
+        found = _existing_files(directory, names)
+        for name in names:
+            if name in found:
+                return directory / name
+    
+    return None
 
 
 class Config(BaseModel):
@@ -56,17 +179,21 @@ class Config(BaseModel):
     # Internal
     _config_file: Optional[Path] = None
     _config_dir: Optional[Path] = None
+    _batch_depth: int = 0
+    _dirty: bool = False
+    _headers_cache: Optional[Tuple[str, Dict[str, str]]] = None
     
-    class Config:
-        """Pydantic config."""
-        extra = "allow"
-        validate_assignment = True
+    model_config = ConfigDict(extra="allow", validate_assignment=True)
     
     def __init__(self, config_file: Optional[Path] = None, debug: bool = False, **kwargs):
         """Initialize configuration."""
-        # Load .env file if it exists
-        from dotenv import load_dotenv
-        load_dotenv()
+        # Load .env file if it exists (once per process)
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            _DOTENV_LOADED = True
+            if os.path.isfile('.env'):
+                from dotenv import load_dotenv
+                load_dotenv('.env')
 
         # Set debug mode first
         if debug:
@@ -77,19 +204,17 @@ class Config(BaseModel):
         kwargs.update(env_config)
         
         # Load from config file
+        if not config_file:
+            # Try to find default config file
+            config_file = self._find_default_config()
         if config_file:
-            file_config = self._load_from_file(config_file)
+            file_config = self._load_from_file(config_file, debug=kwargs.get('debug', False))
             kwargs.update(file_config)
-            self._config_file = config_file
-        else:
-            # Try to find default config file
-            default_config = self._find_default_config()
-            if default_config:
-                file_config = self._load_from_file(default_config)
-                kwargs.update(file_config)
-                self._config_file = default_config
         
         super().__init__(**kwargs)
+
+        # Private attributes only exist once the model is initialized
+        self._config_file = config_file
         
         # Set config directory
         if self._config_file:
@@ -99,95 +224,53 @@ class Config(BaseModel):
     
     def _load_from_env(self) -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        env_mapping = {
-            'OPENROUTER_API_KEY': 'openrouter_api_key',
-            'OPENROUTER_BASE_URL': 'openrouter_base_url',
-            'DEFAULT_MODEL': 'default_model',
-            'DEFAULT_COUNTRY': 'default_country',
-            'DEFAULT_INDUSTRY': 'default_industry',
-            'DEFAULT_PLATFORM': 'default_platform',
-            'DEFAULT_TONE': 'default_tone',
-            'DEFAULT_GOAL': 'default_goal',
-            'DEFAULT_OUTPUT_FORMAT': 'default_output_format',
-            'DEFAULT_OUTPUT_DIR': 'default_output_dir',
-            'MAX_CONTENT_LENGTH': 'max_content_length',
-            'MIN_CONTENT_LENGTH': 'min_content_length',
-            'DEBUG': 'debug',
-            'LOG_LEVEL': 'log_level',
-        }
-        
         config = {}
-        for env_key, config_key in env_mapping.items():
-            value = os.getenv(env_key)
-            if value is not None:
-                # Convert string values to appropriate types
-                if config_key in ['max_content_length', 'min_content_length']:
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        continue
-                elif config_key == 'debug':
-                    value = value.lower() in ('true', '1', 'yes', 'on')
-                elif config_key in ['temperature', 'top_p', 'frequency_penalty', 'presence_penalty', 'min_quality_score']:
-                    try:
-                        value = float(value)
-                    except ValueError:
-                        continue
-                elif config_key == 'max_tokens':
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        continue
-                
-                config[config_key] = value
+        # Usually none of these are set, so intersect before any lookups
+        for env_key in _ENV_KEYS & os.environ.keys():
+            config_key, convert = _ENV_FIELDS[env_key]
+            try:
+                config[config_key] = convert(os.environ[env_key])
+            except ValueError:
+                continue
         
         return config
     
-    def _load_from_file(self, config_file: Path) -> Dict[str, Any]:
-        """Load configuration from file."""
-        if not config_file.exists():
+    def _load_from_file(self, config_file: Path, debug: bool = False) -> Dict[str, Any]:
+        """Load configuration from file, reusing the parse while the file is unchanged."""
+        try:
+            stat = config_file.stat()
+        except OSError:
             return {}
+
+        cache_key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+        cached = _PARSED_CACHE.get(cache_key)
+        if cached is not None:
+            _PARSED_CACHE.move_to_end(cache_key)
+            return cached.copy()
         
         try:
-            if config_file.suffix.lower() == '.json':
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            elif config_file.suffix.lower() in ['.toml', '.tml']:
-                return toml.load(config_file)
-            else:
-                # Try to parse as TOML first, then JSON
-                try:
-                    return toml.load(config_file)
-                except:
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+            loader = _CONFIG_LOADERS.get(config_file.suffix.lower())
+            if loader is None:
+                raise ValueError(f"unsupported format (expected one of {', '.join(_CONFIG_LOADERS)})")
+            data = loader(config_file)
         except Exception as e:
-            if self.debug:
+            # The model is not initialized yet, so the debug flag is passed in
+            if debug:
                 print(f"Warning: Could not load config file {config_file}: {e}")
             return {}
+
+        _PARSED_CACHE[cache_key] = data
+        if len(_PARSED_CACHE) > PARSED_CACHE_SIZE:
+            _PARSED_CACHE.popitem(last=False)
+        return data.copy()
     
     def _find_default_config(self) -> Optional[Path]:
         """Find default configuration file."""
-        possible_locations = [
-            Path.cwd() / "inkforge.toml",
-            Path.cwd() / "inkforge.json",
-            Path.cwd() / ".inkforge.toml",
-            Path.cwd() / ".inkforge.json",
-            Path.home() / ".inkforge" / "config.toml",
-            Path.home() / ".inkforge" / "config.json",
-        ]
-        
-        for location in possible_locations:
-            if location.exists():
-                return location
-        
-        return None
+        return _find_default_config(os.getcwd(), os.path.expanduser('~'))
     
     def _get_default_config_dir(self) -> Path:
-        """Get default configuration directory."""
-        config_dir = Path.home() / ".inkforge"
-        config_dir.mkdir(exist_ok=True)
-        return config_dir
+        """Get default configuration directory (created by save() when needed)."""
+        return Path.home() / ".inkforge"
     
     def save(self, config_file: Optional[Path] = None) -> None:
         """Save configuration to file."""
@@ -201,27 +284,44 @@ class Config(BaseModel):
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Prepare config data (exclude private fields)
-        config_data = self.dict(exclude={'_config_file', '_config_dir'})
+        config_data = self.model_dump()
         
         # Save based on file extension
         if config_file.suffix.lower() == '.json':
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            text = jsonutil.dumps(config_data, indent=True)
         else:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                toml.dump(config_data, f)
+            text = _dump_toml(config_data)
+        is_new_file = not config_file.exists()
+        write_atomic(config_file, [text.encode('utf-8')])
+        if is_new_file:
+            _find_default_config.cache_clear()
         
         self._config_file = config_file
+        self._dirty = False
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
         if hasattr(self, key):
             setattr(self, key, value)
-            # Auto-save if we have a config file
+            # Auto-save if we have a config file, once per batch
             if self._config_file:
-                self.save()
+                if self._batch_depth:
+                    self._dirty = True
+                else:
+                    self.save()
         else:
             raise ValueError(f"Unknown configuration key: {key}")
+
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Group several set() calls into a single save of the config file."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -229,13 +329,9 @@ class Config(BaseModel):
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults."""
-        # Create a new instance with defaults
-        defaults = Config()
-        
-        # Copy default values
-        for field_name, field in self.__fields__.items():
-            if not field_name.startswith('_'):
-                setattr(self, field_name, getattr(defaults, field_name))
+        # Declared defaults are already valid, so skip assignment validation
+        for field_name, field in type(self).model_fields.items():
+            object.__setattr__(self, field_name, field.get_default(call_default_factory=True))
         
         # Save if we have a config file
         if self._config_file:
@@ -246,40 +342,55 @@ class Config(BaseModel):
         return bool(self.openrouter_api_key and self.openrouter_api_key.strip())
     
     def get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for API requests."""
+        """Get HTTP headers for API requests (shared; do not mutate)."""
+        cached = self._headers_cache
+        if cached is not None and cached[0] == self.openrouter_api_key:
+            return cached[1]
+
         if not self.validate_api_key():
             raise ValueError("OpenRouter API key not configured. Please set OPENROUTER_API_KEY environment variable or use 'inkforge config --set openrouter_api_key --value YOUR_KEY'")
         
-        return {
+        headers = {
             "Authorization": f"Bearer {self.openrouter_api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/inkforge/inkforge",
             "X-Title": "InkForge - AI Blog Generator",
         }
+        # Rebuilt only when the API key changes
+        self._headers_cache = (self.openrouter_api_key, headers)
+        return headers
     
-    @validator('default_country')
+    @field_validator('default_country')
+    @classmethod
     def validate_country(cls, v):
         """Validate country code."""
-        try:
-            Country(v.upper())
-            return v.upper()
-        except ValueError:
-            return "US"
+        if v in _COUNTRY_VALUES:
+            return v
+        v = v.upper()
+        return v if v in _COUNTRY_VALUES else "US"
     
-    @validator('default_industry')
+    @field_validator('default_industry')
+    @classmethod
     def validate_industry(cls, v):
         """Validate industry."""
-        try:
-            Industry(v.lower())
-            return v.lower()
-        except ValueError:
-            return "general"
+        if v in _INDUSTRY_VALUES:
+            return v
+        v = v.lower()
+        return v if v in _INDUSTRY_VALUES else "general"
     
-    @validator('default_platform')
+    @field_validator('default_platform')
+    @classmethod
     def validate_platform(cls, v):
         """Validate platform."""
-        try:
-            Platform(v.lower())
-            return v.lower()
-        except ValueError:
-            return "medium"
+        if v in _PLATFORM_VALUES:
+            return v
+        v = v.lower()
+        return v if v in _PLATFORM_VALUES else "medium"
+
+
+# Environment variable -> (config field, converter), derived from the field types
+_ENV_FIELDS = {
+    name.upper(): (name, _ENV_CONVERTERS.get(Config.model_fields[name].annotation, str))
+    for name in _ENV_FIELD_NAMES
+}
+_ENV_KEYS = frozenset(_ENV_FIELDS)
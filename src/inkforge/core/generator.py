@@ -3,27 +3,164 @@
 import re
 import json
 import asyncio
+import hashlib
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 
+import httpx
+
 from .config import Config
-from .ai_service import AIService, AIServiceManager, GenerationConfig
+from .ai_service import RETRYABLE_STATUS_CODES, AIResponse, AIService, AIServiceError, AIServiceManager, GenerationConfig
 from ..models.content import ContentRequest, ContentResponse, OutputFormat
-from ..templates.prompt_manager import PromptManager
+from ..templates.prompt_manager import BATCH_SYSTEM_PROMPT, PromptManager
 from ..processors.humanizer import Humanizer
 from ..processors.engagement_optimizer import EngagementOptimizer
 from ..processors.platform_optimizer import PlatformOptimizer
+from ..utils import jsonutil
 from ..utils.formatters import format_content
+from ..utils.sessions import GENERATIONS_LOG_FILE, SESSION_DATA_FILE, SESSION_HEADER_FILE
+
+
+# Default location for the on-disk response cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "inkforge"
+
+# Maximum number of responses kept in the in-process cache
+RESPONSE_CACHE_SIZE = 256
+
+# Maximum number of formatted outputs kept for re-saving identical responses
+FORMAT_CACHE_SIZE = 256
+
+# Worker threads used to write saved generation files in the background
+SAVE_WORKERS = 4
+
+# Backoff between attempts that failed with an error, in seconds
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+
+# Completion budget for requests packed into one AI call; each answer keeps
+# the configured max_tokens, so this bounds how many requests share a call
+PACKED_MAX_TOKENS = 8000
+
+# Title lines: Markdown H1, explicit title, bold title
+_TITLE_PATTERNS = [
+    re.compile(r'^#\s+(.+)$', re.IGNORECASE),
+    re.compile(r'^Title:\s*(.+)$', re.IGNORECASE),
+    re.compile(r'^\*\*Title:\*\*\s*(.+)$', re.IGNORECASE),
+]
+
+# Lowercased line prefixes that can start a title or a section header; only
+# lines starting with a title prefix are matched against the title patterns
+_TITLE_PREFIXES = ('#', 'title:', '**title:**')
+_TAGS_PREFIXES = ('tag:', 'tags:', 'suggested tag:', 'suggested tags:')
+_TIPS_PREFIXES = ('tip:', 'tips:', 'engagement tip:', 'engagement tips:')
+_PREFIX_LENGTH = max(map(len, _TITLE_PREFIXES + _TAGS_PREFIXES + _TIPS_PREFIXES))
+
+_TAG_SPLIT = re.compile(r'[,;]')
+
+_HEADING_RE = re.compile(r'^#+\s', re.MULTILINE)
+
+# Engagement indicators, one named group per kind
+_ENGAGEMENT_RE = re.compile(
+    r'(?P<question>\?)|(?P<exclamation>!)|(?P<address>\b(?:you|your)\b)'
+    r'|(?P<question_word>\b(?:how|why|what|when|where)\b)',
+    re.IGNORECASE,
+)
+
+# Answers in a packed response, tagged with the id of their request
+_ANSWER_RE = re.compile(r'<answer id=["\']?(\d+)["\']?>\s*(.*?)\s*</answer>', re.DOTALL | re.IGNORECASE)
+
+
+# Session loggers in use: (session_id, session_dir) -> [logger, handlers, users]
+_session_loggers: Dict[Tuple[str, Path], List[Any]] = {}
+_session_loggers_lock = threading.Lock()
+
+
+def _acquire_session_logger(session_id: str, session_dir: Path) -> logging.Logger:
+    """Get the logger for a session, creating its handlers on first use.
+
+    Generators created in the same session share the logger and its log file
+    until the last of them releases it.
+    """
+    key = (session_id, session_dir)
+    with _session_loggers_lock:
+        entry = _session_loggers.get(key)
+        if entry is None:
+            logger = _create_session_logger(session_id, session_dir)
+            entry = _session_loggers[key] = [logger, logger.handlers[:], 0]
+        entry[2] += 1
+        return entry[0]
+
+
+def _release_session_logger(session_id: str, session_dir: Path):
+    """Drop one use of a session logger, closing its handlers after the last."""
+    key = (session_id, session_dir)
+    with _session_loggers_lock:
+        entry = _session_loggers.get(key)
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del _session_loggers[key]
+
+    logger, handlers = entry[0], entry[1]
+    for handler in handlers:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def _create_session_logger(session_id: str, session_dir: Path) -> logging.Logger:
+    """Create the logger for a session with its file and console handlers."""
+    from rich.logging import RichHandler
+
+    from ..utils.console import get_console
+
+    logger = logging.getLogger(f"inkforge_session_{session_id}")
+
+    # Replace handlers left by a session of the same ID in another directory
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    # File handler
+    file_handler = logging.FileHandler(session_dir / "session.log", encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)
+
+    # Console handler, on the shared console so warnings render cleanly
+    # alongside progress displays
+    console_handler = RichHandler(console=get_console(), show_path=False)
+    console_handler.setLevel(logging.WARNING)
+
+    # Formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
+    return logger
 
 
 class ContentGenerator:
     """Main content generator class."""
 
-    def __init__(self, config: Config):
-        """Initialize content generator."""
+    def __init__(self, config: Config, cache_dir: Optional[Path] = None):
+        """Initialize content generator.
+
+        When ``cache_dir`` is given, responses are memoized in-process and on
+        disk, keyed by the request and the generation settings.
+        """
         self.config = config
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._response_cache: "OrderedDict[str, ContentResponse]" = OrderedDict()
         self.ai_manager = AIServiceManager(config)
         self.prompt_manager = PromptManager()
 
@@ -37,6 +174,19 @@ class ContentGenerator:
         self.session_dir = Path(config.default_output_dir) / "sessions" / self.session_id
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Per-session sequence keeps generation IDs unique when generations run concurrently
+        self._generation_seq = itertools.count(1)
+
+        # One AI service (and HTTP connection pool) per event loop
+        self._ai_service: Optional[AIService] = None
+        self._ai_service_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Generation files are written off the generation path
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_saves: List[Future] = []
+        self._format_cache: "OrderedDict[Tuple[str, OutputFormat], str]" = OrderedDict()
+        self._format_lock = threading.Lock()
+
         # Setup logging
         self._setup_logging()
 
@@ -47,50 +197,27 @@ class ContentGenerator:
             "config": config.dict(exclude={'_config_file', '_config_dir'}),
             "generations": []
         }
+        self._save_session_header()
     
     def _setup_logging(self):
         """Setup session logging."""
-        log_file = self.session_dir / "session.log"
-
-        # Create logger
-        self.logger = logging.getLogger(f"inkforge_session_{self.session_id}")
+        self.logger = _acquire_session_logger(self.session_id, self.session_dir)
+        self._logger_released = False
         self.logger.setLevel(logging.DEBUG if self.config.debug else logging.INFO)
-
-        # Remove existing handlers
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
-
-        # File handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.WARNING)
-
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-
         self.logger.info(f"Session {self.session_id} started")
 
     def generate(self, request: ContentRequest, auto_save: bool = True, save_formats: Optional[List[OutputFormat]] = None) -> ContentResponse:
         """Generate content synchronously."""
-        return asyncio.run(self.generate_async(request, auto_save, save_formats))
+        return asyncio.run(self._run_and_close(self.generate_async(request, auto_save, save_formats)))
     
     async def generate_async(self, request: ContentRequest, auto_save: bool = True, save_formats: Optional[List[OutputFormat]] = None) -> ContentResponse:
         """Generate content asynchronously."""
         generation_start = datetime.now()
-        generation_id = f"gen_{generation_start.strftime('%H%M%S')}"
+        generation_id = f"gen_{generation_start.strftime('%H%M%S')}_{next(self._generation_seq)}"
 
         self.logger.info(f"Starting generation {generation_id}")
-        self.logger.info(f"Request: {request.dict()}")
+        request_snapshot = request.dict()
+        self.logger.info(f"Request: {request_snapshot}")
 
         # Default save formats
         if save_formats is None:
@@ -104,31 +231,42 @@ class ContentGenerator:
         
         # Generate prompt
         self.logger.info("Generating prompt...")
+        system_prompt = self.prompt_manager.generate_system_prompt(request)
         prompt = self.prompt_manager.generate_prompt(request)
         self.logger.debug(f"Generated prompt ({len(prompt)} chars): {prompt[:200]}...")
 
+        # Serve identical requests from the response cache
+        cache_key = self._cache_key(request) if self.cache_dir is not None else None
+        if cache_key is not None:
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                self.logger.info(f"Generation {generation_id} served from cache ({cache_key[:12]})")
+                if auto_save:
+                    generation_data = {
+                        "generation_id": generation_id,
+                        "request": request_snapshot,
+                        "prompt": prompt,
+                        "cache_key": cache_key,
+                        "cache_hit": True,
+                        "attempts": [{"ai_response": {}}],
+                        "success": True,
+                        "start_time": generation_start.isoformat(),
+                        "end_time": datetime.now().isoformat(),
+                    }
+                    self._save_generation(generation_id, request, cached_response, generation_data, save_formats)
+                return cached_response
+
         # Create generation config
-        generation_config = GenerationConfig(
-            model=self.config.default_model,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
-            top_p=self.config.top_p,
-            frequency_penalty=self.config.frequency_penalty,
-            presence_penalty=self.config.presence_penalty,
-            enable_humanization=self.config.enable_humanization,
-            enable_engagement_optimization=self.config.enable_engagement_optimization,
-            enable_platform_optimization=self.config.enable_platform_optimization,
-            min_quality_score=self.config.min_quality_score,
-            max_retries=self.config.max_retries,
-        )
-        self.logger.info(f"Generation config: {generation_config.dict()}")
+        generation_config = self._build_generation_config(system_prompt)
+        config_snapshot = generation_config.dict()
+        self.logger.info(f"Generation config: {config_snapshot}")
         
         # Generate content with retries
         generation_data = {
             "generation_id": generation_id,
-            "request": request.dict(),
+            "request": request_snapshot,
             "prompt": prompt,
-            "config": generation_config.dict(),
+            "config": config_snapshot,
             "attempts": [],
             "start_time": generation_start.isoformat()
         }
@@ -148,28 +286,25 @@ class ContentGenerator:
                 self.logger.debug(f"Config API key present: {bool(self.config.openrouter_api_key)}")
                 self.logger.debug(f"Config validation: {self.config.validate_api_key()}")
 
-                async with AIService(self.config) as ai_service:
-                    self.logger.info("Calling AI service...")
-                    ai_response = await ai_service.generate_content(prompt, generation_config)
+                ai_service = self._get_ai_service()
+                self.logger.info("Calling AI service...")
+                ai_response = await ai_service.generate_content(prompt, generation_config)
 
-                    attempt_data.update({
-                        "ai_response": {
-                            "model": ai_response.model,
-                            "usage": ai_response.usage,
-                            "finish_reason": ai_response.finish_reason,
-                            "response_time": ai_response.metadata.get("response_time", 0),
-                            "content_length": len(ai_response.content)
-                        }
-                    })
+                attempt_data.update({
+                    "ai_response": {
+                        "model": ai_response.model,
+                        "usage": ai_response.usage,
+                        "finish_reason": ai_response.finish_reason,
+                        "response_time": ai_response.metadata.get("response_time", 0),
+                        "content_length": len(ai_response.content)
+                    }
+                })
 
-                    self.logger.info(f"AI response received: {ai_response.usage}")
+                self.logger.info(f"AI response received: {ai_response.usage}")
 
-                # Parse AI response
+                # Parse AI response and check quality
                 self.logger.info("Parsing AI response...")
-                parsed_content = self._parse_ai_response(ai_response.content)
-
-                # Quality check
-                quality_score = self._calculate_quality_score(parsed_content, request)
+                parsed_content, quality_score = await self._score_response(ai_response.content, request)
                 attempt_data["quality_score"] = quality_score
 
                 self.logger.info(f"Quality score: {quality_score:.2f} (threshold: {generation_config.min_quality_score})")
@@ -180,7 +315,7 @@ class ContentGenerator:
                     processed_content = await self._process_content(parsed_content, request)
 
                     # Create response
-                    response = self._create_response(processed_content, request, ai_response)
+                    response = self._create_response(processed_content, request, ai_response, request_snapshot)
 
                     # Mark attempt as successful
                     attempt_data.update({
@@ -196,6 +331,9 @@ class ContentGenerator:
                     if auto_save:
                         self._save_generation(generation_id, request, response, generation_data, save_formats)
 
+                    if cache_key is not None:
+                        self._store_cached_response(cache_key, response)
+
                     self.logger.info(f"Generation {generation_id} completed successfully")
                     return response
                 else:
@@ -211,7 +349,7 @@ class ContentGenerator:
                         # Use the content anyway but warn about quality
                         self.logger.warning("Using low-quality content after max retries")
                         processed_content = await self._process_content(parsed_content, request)
-                        response = self._create_response(processed_content, request, ai_response)
+                        response = self._create_response(processed_content, request, ai_response, request_snapshot)
                         response.metadata["quality_warning"] = f"Content quality score ({quality_score:.2f}) below threshold ({generation_config.min_quality_score})"
 
                         attempt_data.update({
@@ -242,8 +380,10 @@ class ContentGenerator:
                     "end_time": datetime.now().isoformat()
                 })
 
-                if attempt < generation_config.max_retries - 1:
-                    self.logger.info("Retrying after error...")
+                if attempt < generation_config.max_retries - 1 and not self._retried_by_service(e):
+                    delay = self._retry_delay(attempt)
+                    self.logger.info(f"Retrying after error in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
                 else:
                     generation_data["attempts"].append(attempt_data)
                     generation_data["success"] = False
@@ -269,23 +409,411 @@ class ContentGenerator:
 
         raise RuntimeError(error_msg)
     
+    def generate_stream(
+        self,
+        request: ContentRequest,
+        auto_save: bool = True,
+        save_formats: Optional[List[OutputFormat]] = None,
+    ) -> "ContentStream":
+        """Generate content as a stream of text chunks.
+
+        Iterate the returned stream with ``async for``; once it is exhausted the
+        processed result is available as ``stream.response``. Streamed output
+        is shown as it arrives, so low quality scores are recorded in the
+        response metadata rather than triggering a retry.
+        """
+        return ContentStream(self, request, auto_save, save_formats)
+
+    async def _stream_chunks(
+        self,
+        stream: "ContentStream",
+    ) -> AsyncIterator[str]:
+        """Stream a generation and build its final response once complete."""
+        request = stream.request
+        generation_start = datetime.now()
+        generation_id = f"gen_{generation_start.strftime('%H%M%S')}_{next(self._generation_seq)}"
+
+        self.logger.info(f"Starting streamed generation {generation_id}")
+        request_snapshot = request.dict()
+        self.logger.info(f"Request: {request_snapshot}")
+
+        save_formats = stream.save_formats
+        if save_formats is None:
+            save_formats = [OutputFormat.MARKDOWN, OutputFormat.HTML, OutputFormat.JSON]
+
+        if not self.ai_manager.validate_configuration():
+            error_msg = "AI service configuration is invalid. Please check your API key and settings."
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        prompt = self.prompt_manager.generate_prompt(request)
+        generation_config = self._build_generation_config(self.prompt_manager.generate_system_prompt(request))
+
+        chunks = []
+        ai_service = self._get_ai_service()
+        async for chunk in ai_service.generate_content_stream(prompt, generation_config):
+            chunks.append(chunk)
+            yield chunk
+
+        raw_content = "".join(chunks)
+        ai_response = AIResponse(
+            content=raw_content,
+            model=generation_config.model,
+            usage={},
+            finish_reason="stop",
+            metadata={"response_time": (datetime.now() - generation_start).total_seconds()},
+        )
+
+        parsed_content, quality_score = await self._score_response(raw_content, request)
+        processed_content = await self._process_content(parsed_content, request)
+        response = self._create_response(processed_content, request, ai_response, request_snapshot)
+        response.metadata["quality_score"] = quality_score
+        if quality_score < generation_config.min_quality_score:
+            response.metadata["quality_warning"] = f"Content quality score ({quality_score:.2f}) below threshold ({generation_config.min_quality_score})"
+
+        if stream.auto_save:
+            generation_data = {
+                "generation_id": generation_id,
+                "request": request_snapshot,
+                "prompt": prompt,
+                "config": generation_config.dict(),
+                "streamed": True,
+                "attempts": [{
+                    "attempt": 1,
+                    "start_time": generation_start.isoformat(),
+                    "prompt_length": len(prompt),
+                    "ai_response": {
+                        "model": ai_response.model,
+                        "usage": ai_response.usage,
+                        "finish_reason": ai_response.finish_reason,
+                        "response_time": ai_response.metadata["response_time"],
+                        "content_length": len(raw_content),
+                    },
+                    "quality_score": quality_score,
+                    "success": True,
+                    "end_time": datetime.now().isoformat(),
+                    "final_word_count": response.word_count,
+                }],
+                "success": True,
+                "start_time": generation_start.isoformat(),
+                "end_time": datetime.now().isoformat(),
+            }
+            self._save_generation(generation_id, request, response, generation_data, save_formats)
+
+        self.logger.info(f"Streamed generation {generation_id} completed")
+        stream.response = response
+
+    def generate_batch(
+        self,
+        requests: Sequence[ContentRequest],
+        auto_save: bool = True,
+        save_formats: Optional[Sequence[Optional[List[OutputFormat]]]] = None,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+        pack_size: int = 1,
+    ) -> List[Union[ContentResponse, BaseException]]:
+        """Generate content for several requests synchronously."""
+        return asyncio.run(self._run_and_close(self.generate_batch_async(
+            requests, auto_save, save_formats, max_concurrency, return_exceptions, pack_size
+        )))
+
+    async def generate_batch_async(
+        self,
+        requests: Sequence[ContentRequest],
+        auto_save: bool = True,
+        save_formats: Optional[Sequence[Optional[List[OutputFormat]]]] = None,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+        pack_size: int = 1,
+    ) -> List[Union[ContentResponse, BaseException]]:
+        """Generate content for several requests concurrently.
+
+        ``save_formats`` holds one entry per request. Results are returned in
+        request order; with ``return_exceptions`` a failed request yields its
+        exception instead of aborting the whole batch.
+
+        With ``pack_size`` above one, up to that many requests share a single
+        AI call, so the instructions and round trip are paid once per pack.
+        Packs are capped so every answer keeps the configured ``max_tokens``.
+        """
+        if save_formats is None:
+            save_formats = [None] * len(requests)
+        elif len(save_formats) != len(requests):
+            raise ValueError("save_formats must have one entry per request")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pack_size = min(pack_size, PACKED_MAX_TOKENS // self.config.max_tokens)
+
+        if pack_size <= 1:
+            async def run(request: ContentRequest, formats: Optional[List[OutputFormat]]) -> ContentResponse:
+                async with semaphore:
+                    return await self.generate_async(request, auto_save, formats)
+
+            self.logger.info(f"Starting batch of {len(requests)} generations")
+            return await asyncio.gather(
+                *[run(request, formats) for request, formats in zip(requests, save_formats)],
+                return_exceptions=return_exceptions,
+            )
+
+        async def run_pack(start: int) -> List[Union[ContentResponse, BaseException]]:
+            async with semaphore:
+                return await self._generate_pack(
+                    requests[start:start + pack_size], auto_save, save_formats[start:start + pack_size]
+                )
+
+        self.logger.info(f"Starting batch of {len(requests)} generations in packs of {pack_size}")
+        packs = await asyncio.gather(*[run_pack(start) for start in range(0, len(requests), pack_size)])
+        results = [result for pack in packs for result in pack]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    async def _generate_pack(
+        self,
+        requests: Sequence[ContentRequest],
+        auto_save: bool,
+        save_formats: Sequence[Optional[List[OutputFormat]]],
+    ) -> List[Union[ContentResponse, BaseException]]:
+        """Generate several requests with one AI call.
+
+        Cached requests, answers missing from the response and answers below
+        the quality threshold fall back to ``generate_async``.
+        """
+        generation_start = datetime.now()
+        packed = [
+            index for index, request in enumerate(requests)
+            if self.cache_dir is None or self._get_cached_response(self._cache_key(request)) is None
+        ]
+
+        answers: Dict[int, str] = {}
+        if len(packed) > 1 and self.ai_manager.validate_configuration():
+            prompt = self.prompt_manager.generate_batch_prompt([requests[index] for index in packed])
+            generation_config = self._build_generation_config()
+            generation_config.max_tokens = min(generation_config.max_tokens * len(packed), PACKED_MAX_TOKENS)
+            generation_config.system_prompt = BATCH_SYSTEM_PROMPT
+            config_snapshot = generation_config.dict()
+
+            self.logger.info(f"Packing {len(packed)} requests into one AI call")
+            try:
+                ai_response = await self._get_ai_service().generate_content(prompt, generation_config)
+            except Exception as e:
+                self.logger.warning(f"Packed generation failed, generating requests separately: {e}")
+            else:
+                for match in _ANSWER_RE.finditer(ai_response.content):
+                    position = int(match.group(1)) - 1
+                    if 0 <= position < len(packed):
+                        answers[packed[position]] = match.group(2)
+
+        async def finish(index: int) -> ContentResponse:
+            request, formats = requests[index], save_formats[index]
+            answer = answers.get(index)
+            if answer is None:
+                return await self.generate_async(request, auto_save, formats)
+
+            parsed_content, quality_score = await self._score_response(answer, request)
+            if quality_score < generation_config.min_quality_score:
+                self.logger.warning(f"Packed answer for '{request.topic}' scored {quality_score:.2f}, generating it separately")
+                return await self.generate_async(request, auto_save, formats)
+
+            answer_response = AIResponse.model_construct(
+                content=answer,
+                model=ai_response.model,
+                usage=ai_response.usage,
+                finish_reason=ai_response.finish_reason,
+                metadata=ai_response.metadata,
+            )
+            request_snapshot = request.dict()
+            processed_content = await self._process_content(parsed_content, request)
+            response = self._create_response(processed_content, request, answer_response, request_snapshot)
+            response.metadata["batch_size"] = len(answers)
+
+            if auto_save:
+                generation_id = f"gen_{generation_start.strftime('%H%M%S')}_{next(self._generation_seq)}"
+                generation_data = {
+                    "generation_id": generation_id,
+                    "request": request_snapshot,
+                    "prompt": prompt,
+                    "config": config_snapshot,
+                    "batch_size": len(answers),
+                    "attempts": [{
+                        "attempt": 1,
+                        "start_time": generation_start.isoformat(),
+                        "prompt_length": len(prompt),
+                        "ai_response": {
+                            "model": ai_response.model,
+                            "usage": ai_response.usage,
+                            "finish_reason": ai_response.finish_reason,
+                            "response_time": ai_response.metadata.get("response_time", 0),
+                            "content_length": len(answer),
+                        },
+                        "quality_score": quality_score,
+                        "success": True,
+                        "end_time": datetime.now().isoformat(),
+                        "final_word_count": response.word_count,
+                    }],
+                    "success": True,
+                    "start_time": generation_start.isoformat(),
+                    "end_time": datetime.now().isoformat(),
+                }
+                if formats is None:
+                    formats = [OutputFormat.MARKDOWN, OutputFormat.HTML, OutputFormat.JSON]
+                self._save_generation(generation_id, request, response, generation_data, formats)
+
+            if self.cache_dir is not None:
+                self._store_cached_response(self._cache_key(request), response)
+            return response
+
+        return await asyncio.gather(*[finish(index) for index in range(len(requests))], return_exceptions=True)
+
+    def _get_ai_service(self) -> AIService:
+        """Get the AI service for the running event loop, creating it on first use.
+
+        Reusing one service keeps HTTP connections alive across generations.
+        A client cannot outlive its event loop, so a new loop gets a new service.
+        """
+        loop = asyncio.get_running_loop()
+        if self._ai_service is None or self._ai_service_loop is not loop:
+            self._ai_service = AIService(self.config)
+            self._ai_service_loop = loop
+        return self._ai_service
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared AI service and its HTTP connections."""
+        if self._ai_service is not None:
+            await self._ai_service.aclose()
+            self._ai_service = None
+            self._ai_service_loop = None
+
+    async def _run_and_close(self, coro):
+        """Run a coroutine, then close the AI service bound to its event loop."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    def _retried_by_service(self, error: Exception) -> bool:
+        """Check whether the AI service already retried an error in place.
+
+        Rate-limit and server errors are retried with backoff (honoring
+        ``Retry-After``) by the service, so retrying them here too would
+        multiply the requests sent.
+        """
+        cause = error.__cause__
+        return (
+            isinstance(error, AIServiceError)
+            and isinstance(cause, httpx.HTTPStatusError)
+            and cause.response.status_code in RETRYABLE_STATUS_CODES
+        )
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Get the exponential backoff with jitter before retrying a failed attempt."""
+        delay = min(RETRY_BACKOFF_BASE * 2 ** attempt, RETRY_BACKOFF_MAX)
+        return random.uniform(delay / 2, delay)
+
+    def _build_generation_config(self, system_prompt: Optional[str] = None) -> GenerationConfig:
+        """Create the generation config from the current settings."""
+        return GenerationConfig(
+            model=self.config.default_model,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            top_p=self.config.top_p,
+            frequency_penalty=self.config.frequency_penalty,
+            presence_penalty=self.config.presence_penalty,
+            enable_humanization=self.config.enable_humanization,
+            enable_engagement_optimization=self.config.enable_engagement_optimization,
+            enable_platform_optimization=self.config.enable_platform_optimization,
+            min_quality_score=self.config.min_quality_score,
+            max_retries=self.config.max_retries,
+            system_prompt=system_prompt,
+        )
+
+    def _cache_key(self, request: ContentRequest) -> str:
+        """Build a stable cache key from the request and generation settings."""
+        key_data = {
+            "request": request.model_dump(mode="json"),
+            "model": self.config.default_model,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+            "frequency_penalty": self.config.frequency_penalty,
+            "presence_penalty": self.config.presence_penalty,
+            "enable_humanization": self.config.enable_humanization,
+            "enable_engagement_optimization": self.config.enable_engagement_optimization,
+            "enable_platform_optimization": self.config.enable_platform_optimization,
+        }
+        serialized = json.dumps(key_data, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _get_cached_response(self, cache_key: str) -> Optional[ContentResponse]:
+        """Look up a cached response in memory, then on disk."""
+        response = self._response_cache.get(cache_key)
+        if response is None:
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            try:
+                response = ContentResponse.model_validate_json(cache_file.read_bytes())
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+                return None
+            self._remember_response(cache_key, response)
+        else:
+            self._response_cache.move_to_end(cache_key)
+
+        # Hand out a copy so callers cannot mutate the cached entry
+        return response.model_copy(deep=True)
+
+    def _store_cached_response(self, cache_key: str, response: ContentResponse):
+        """Store a response in memory and write it through to disk."""
+        self._remember_response(cache_key, response.model_copy(deep=True))
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            cache_file.write_text(response.model_dump_json(), encoding='utf-8')
+        except OSError as e:
+            self.logger.warning(f"Failed to write response cache: {e}")
+
+    def _remember_response(self, cache_key: str, response: ContentResponse):
+        """Add a response to the in-process LRU cache."""
+        self._response_cache[cache_key] = response
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def _score_response(self, content: str, request: ContentRequest) -> Tuple[Dict[str, Any], float]:
+        """Parse and score an AI response on a worker thread.
+
+        Long responses take a while to scan, and concurrent generations share
+        the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._parse_and_score, content, request)
+
+    def _parse_and_score(self, content: str, request: ContentRequest) -> Tuple[Dict[str, Any], float]:
+        """Parse an AI response and calculate its quality score."""
+        parsed_content = self._parse_ai_response(content)
+        return parsed_content, self._calculate_quality_score(parsed_content, request)
+
     def _parse_ai_response(self, content: str) -> Dict[str, Any]:
         """Parse AI response to extract title, content, and metadata."""
-        lines = content.strip().split('\n')
+        lines = content.strip().splitlines()
         
         # Try to extract structured response
         title = ""
-        main_content = ""
+        content_lines = []
         tags = []
         engagement_tips = []
         
-        # Look for title patterns
-        title_patterns = [
-            r'^#\s+(.+)$',  # Markdown H1
-            r'^Title:\s*(.+)$',  # Explicit title
-            r'^\*\*Title:\*\*\s*(.+)$',  # Bold title
-        ]
-        
         content_started = False
         current_section = "content"
         
@@ -294,19 +822,21 @@ class ContentGenerator:
             if not line:
                 continue
             
+            head = line[:_PREFIX_LENGTH].lower()
+
             # Check for title
-            if not title:
-                for pattern in title_patterns:
-                    match = re.match(pattern, line, re.IGNORECASE)
+            if not title and head.startswith(_TITLE_PREFIXES):
+                for pattern in _TITLE_PATTERNS:
+                    match = pattern.match(line)
                     if match:
                         title = match.group(1).strip()
                         continue
             
             # Check for sections
-            if re.match(r'^(tags?|suggested tags?):', line, re.IGNORECASE):
+            if head.startswith(_TAGS_PREFIXES):
                 current_section = "tags"
                 continue
-            elif re.match(r'^(engagement tips?|tips?):', line, re.IGNORECASE):
+            elif head.startswith(_TIPS_PREFIXES):
                 current_section = "tips"
                 continue
             elif line.startswith('#') and title:
@@ -316,24 +846,21 @@ class ContentGenerator:
             # Process based on current section
             if current_section == "tags":
                 # Extract tags
-                tag_line = re.sub(r'^(tags?|suggested tags?):\s*', '', line, flags=re.IGNORECASE)
-                extracted_tags = [tag.strip() for tag in re.split(r'[,;]', tag_line) if tag.strip()]
+                extracted_tags = [tag.strip() for tag in _TAG_SPLIT.split(line) if tag.strip()]
                 tags.extend(extracted_tags)
             elif current_section == "tips":
                 # Extract engagement tips
-                tip_line = re.sub(r'^(engagement tips?|tips?):\s*', '', line, flags=re.IGNORECASE)
-                if tip_line:
-                    engagement_tips.append(tip_line)
+                engagement_tips.append(line)
             else:
                 # Main content
                 if title and (content_started or not line.startswith('#')):
-                    main_content += line + '\n'
+                    content_lines.append(line)
                 elif not title:
                     # If no title found yet, treat first substantial line as title
                     if len(line) > 10 and not line.startswith('-') and not line.startswith('*'):
                         title = line
                     else:
-                        main_content += line + '\n'
+                        content_lines.append(line)
         
         # Fallback: if no title extracted, use first line or generate one
         if not title:
@@ -344,7 +871,7 @@ class ContentGenerator:
                 title = "Generated Content"
         
         # Clean up content
-        main_content = main_content.strip()
+        main_content = '\n'.join(content_lines)
         if not main_content:
             main_content = content
         
@@ -375,7 +902,7 @@ class ContentGenerator:
             score += 0.15
         
         # Check for structure (headings, paragraphs)
-        if re.search(r'^#+\s', content, re.MULTILINE):  # Has headings
+        if _HEADING_RE.search(content):  # Has headings
             score += 0.1
         
         if content.count('\n\n') >= 2:  # Has multiple paragraphs
@@ -383,26 +910,21 @@ class ContentGenerator:
         
         # Check for keywords inclusion
         if request.keywords:
-            keywords_found = sum(1 for keyword in request.keywords 
-                               if keyword.lower() in content.lower())
+            content_lower = content.lower()
+            keywords_found = sum(1 for keyword in request.keywords if keyword.lower() in content_lower)
             keyword_score = min(keywords_found / len(request.keywords), 1.0) * 0.2
             score += keyword_score
         else:
             score += 0.2  # Full score if no keywords specified
         
-        # Check for engagement elements
-        engagement_indicators = [
-            r'\?',  # Questions
-            r'!',   # Exclamations
-            r'\b(you|your)\b',  # Direct address
-            r'\b(how|why|what|when|where)\b',  # Question words
-        ]
-        
-        engagement_count = sum(1 for pattern in engagement_indicators 
-                             if re.search(pattern, content, re.IGNORECASE))
-        
-        if engagement_count >= 3:
-            score += 0.1
+        # Check for engagement elements: questions, exclamations, direct
+        # address and question words, in a single pass
+        engagement_kinds = set()
+        for match in _ENGAGEMENT_RE.finditer(content):
+            engagement_kinds.add(match.lastgroup)
+            if len(engagement_kinds) >= 3:
+                score += 0.1
+                break
         
         return min(score, max_score)
 
@@ -413,49 +935,30 @@ class ContentGenerator:
             gen_dir = self.session_dir / generation_id
             gen_dir.mkdir(exist_ok=True)
 
-            # Save metadata
-            metadata_file = gen_dir / "metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(generation_data, f, indent=2, ensure_ascii=False, default=str)
+            # Save metadata, raw AI response and prompt used
+            self._submit_save(self._save_json, gen_dir / "metadata.json", generation_data)
+            self._submit_save(
+                self._save_text,
+                gen_dir / "raw_response.txt",
+                generation_data["attempts"][-1]["ai_response"].get("content", ""),
+            )
+            self._submit_save(self._save_text, gen_dir / "prompt.txt", generation_data["prompt"])
 
             # Generate safe filename from topic
             safe_topic = "".join(c for c in request.topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
             safe_topic = safe_topic.replace(' ', '_')[:50]  # Limit length
 
             # Save in requested formats
+            extensions = {
+                OutputFormat.MARKDOWN: '.md',
+                OutputFormat.HTML: '.html',
+                OutputFormat.JSON: '.json',
+                OutputFormat.PLAIN: '.txt'
+            }
             for format_type in save_formats:
-                try:
-                    formatted_content = format_content(response, format_type)
-
-                    # Determine file extension
-                    extensions = {
-                        OutputFormat.MARKDOWN: '.md',
-                        OutputFormat.HTML: '.html',
-                        OutputFormat.JSON: '.json',
-                        OutputFormat.PLAIN: '.txt'
-                    }
-
-                    ext = extensions.get(format_type, '.txt')
-                    filename = f"{safe_topic}_{generation_id}{ext}"
-                    file_path = gen_dir / filename
-
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(formatted_content)
-
-                    self.logger.info(f"Saved {format_type.value} format: {file_path}")
-
-                except Exception as e:
-                    self.logger.error(f"Failed to save {format_type.value} format: {e}")
-
-            # Save raw AI response
-            raw_file = gen_dir / "raw_response.txt"
-            with open(raw_file, 'w', encoding='utf-8') as f:
-                f.write(generation_data["attempts"][-1]["ai_response"].get("content", ""))
-
-            # Save prompt used
-            prompt_file = gen_dir / "prompt.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(generation_data["prompt"])
+                ext = extensions.get(format_type, '.txt')
+                file_path = gen_dir / f"{safe_topic}_{generation_id}{ext}"
+                self._submit_save(self._save_format, response, format_type, file_path)
 
             # Update session data
             self.session_data["generations"].append({
@@ -467,14 +970,82 @@ class ContentGenerator:
                 "directory": str(gen_dir.relative_to(self.session_dir))
             })
 
-            # Save updated session data
-            self._save_session_data()
+            # Append to the session's generation log
+            self._append_generation_log()
 
             self.logger.info(f"Generation {generation_id} saved successfully to {gen_dir}")
 
         except Exception as e:
             self.logger.error(f"Failed to save generation {generation_id}: {e}")
 
+    def _submit_save(self, fn, *args):
+        """Run a file write on the background I/O pool."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=SAVE_WORKERS)
+        self._pending_saves.append(self._io_pool.submit(fn, *args))
+
+    def _save_text(self, file_path: Path, text: str):
+        """Write a text file of a generation."""
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception as e:
+            self.logger.error(f"Failed to save {file_path.name}: {e}")
+
+    def _save_json(self, file_path: Path, data: Dict[str, Any]):
+        """Write a JSON metadata file of a generation."""
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(jsonutil.dumps(data, indent=True, default=str))
+        except Exception as e:
+            self.logger.error(f"Failed to save {file_path.name}: {e}")
+
+    def _save_format(self, response: ContentResponse, format_type: OutputFormat, file_path: Path):
+        """Write one output format of a generation."""
+        try:
+            formatted_content = self._format_response(response, format_type)
+
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(formatted_content)
+
+            self.logger.info(f"Saved {format_type.value} format: {file_path}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to save {format_type.value} format: {e}")
+
+    def _format_response(self, response: ContentResponse, format_type: OutputFormat) -> str:
+        """Format a response, reusing the output of an identical earlier response."""
+        digest = hashlib.blake2b(response.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+        key = (digest, format_type)
+        with self._format_lock:
+            formatted_content = self._format_cache.get(key)
+            if formatted_content is not None:
+                self._format_cache.move_to_end(key)
+                return formatted_content
+
+        formatted_content = format_content(response, format_type)
+        with self._format_lock:
+            self._format_cache[key] = formatted_content
+            while len(self._format_cache) > FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        return formatted_content
+
+    def wait_for_saves(self):
+        """Block until all background file writes have finished."""
+        pending, self._pending_saves = self._pending_saves, []
+        wait(pending)
+
+    def close(self):
+        """Finish pending writes, save the combined session data and release background workers and log files."""
+        self.wait_for_saves()
+        self._save_session_data()
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
+        if not self._logger_released:
+            self._logger_released = True
+            _release_session_logger(self.session_id, self.session_dir)
+
     def _save_failed_generation(self, generation_id: str, request: ContentRequest, generation_data: Dict[str, Any]):
         """Save failed generation data for debugging."""
         try:
@@ -482,15 +1053,9 @@ class ContentGenerator:
             gen_dir = self.session_dir / f"{generation_id}_FAILED"
             gen_dir.mkdir(exist_ok=True)
 
-            # Save metadata
-            metadata_file = gen_dir / "failed_metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(generation_data, f, indent=2, ensure_ascii=False, default=str)
-
-            # Save prompt used
-            prompt_file = gen_dir / "prompt.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(generation_data["prompt"])
+            # Save metadata and prompt used
+            self._submit_save(self._save_json, gen_dir / "failed_metadata.json", generation_data)
+            self._submit_save(self._save_text, gen_dir / "prompt.txt", generation_data["prompt"])
 
             # Update session data
             self.session_data["generations"].append({
@@ -501,28 +1066,49 @@ class ContentGenerator:
                 "directory": str(gen_dir.relative_to(self.session_dir))
             })
 
-            # Save updated session data
-            self._save_session_data()
+            # Append to the session's generation log
+            self._append_generation_log()
 
             self.logger.info(f"Failed generation {generation_id} data saved to {gen_dir}")
 
         except Exception as e:
             self.logger.error(f"Failed to save failed generation data: {e}")
 
+    def _save_session_header(self):
+        """Save the session details that do not change as generations are added."""
+        try:
+            header = {key: value for key, value in self.session_data.items() if key != "generations"}
+            with open(self.session_dir / SESSION_HEADER_FILE, 'w', encoding='utf-8') as f:
+                f.write(jsonutil.dumps(header, indent=True, default=str))
+
+        except Exception as e:
+            self.logger.error(f"Failed to save session header: {e}")
+
+    def _append_generation_log(self):
+        """Append the latest generation entry to the session's generation log."""
+        try:
+            entry = jsonutil.dumps(self.session_data["generations"][-1], default=str)
+            with open(self.session_dir / GENERATIONS_LOG_FILE, 'a', encoding='utf-8') as f:
+                f.write(entry + '\n')
+
+        except Exception as e:
+            self.logger.error(f"Failed to append to generation log: {e}")
+
     def _save_session_data(self):
-        """Save session data to file."""
+        """Save the combined session data file."""
         try:
-            session_file = self.session_dir / "session_data.json"
+            session_file = self.session_dir / SESSION_DATA_FILE
             self.session_data["last_updated"] = datetime.now().isoformat()
 
             with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(self.session_data, f, indent=2, ensure_ascii=False, default=str)
+                f.write(jsonutil.dumps(self.session_data, indent=True, default=str))
 
         except Exception as e:
             self.logger.error(f"Failed to save session data: {e}")
 
     def get_session_summary(self) -> Dict[str, Any]:
         """Get summary of current session."""
+        self.wait_for_saves()
         total_generations = len(self.session_data["generations"])
         successful_generations = sum(1 for g in self.session_data["generations"] if g["success"])
 
@@ -572,7 +1158,7 @@ class ContentGenerator:
         parsed_content["content"] = content
         return parsed_content
     
-    def _create_response(self, processed_content: Dict[str, Any], request: ContentRequest, ai_response) -> ContentResponse:
+    def _create_response(self, processed_content: Dict[str, Any], request: ContentRequest, ai_response, request_snapshot: Optional[Dict[str, Any]] = None) -> ContentResponse:
         """Create final content response."""
         content = processed_content["content"]
         word_count = len(content.split())
@@ -584,7 +1170,7 @@ class ContentGenerator:
                 "generation_model": ai_response.model,
                 "generation_time": datetime.now().isoformat(),
                 "usage": ai_response.usage,
-                "request_params": request.dict(),
+                "request_params": request_snapshot if request_snapshot is not None else request.dict(),
                 "response_time": ai_response.metadata.get("response_time", 0),
             },
             engagement_tips=processed_content.get("engagement_tips", []),
@@ -593,3 +1179,28 @@ class ContentGenerator:
             estimated_read_time=max(1, round(word_count / 200)),
             tags=processed_content.get("tags", []),
         )
+
+
+class ContentStream:
+    """Async iterator over streamed content chunks.
+
+    ``response`` holds the final ``ContentResponse`` once iteration completes.
+    """
+
+    def __init__(
+        self,
+        generator: ContentGenerator,
+        request: ContentRequest,
+        auto_save: bool = True,
+        save_formats: Optional[List[OutputFormat]] = None,
+    ):
+        """Initialize content stream."""
+        self.request = request
+        self.auto_save = auto_save
+        self.save_formats = save_formats
+        self.response: Optional[ContentResponse] = None
+        self._chunks = generator._stream_chunks(self)
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        """Async iterator entry."""
+        return self._chunks
@@ -0,0 +1,52 @@
+"""Response cache for deterministic AI requests."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """In-process LRU cache of AI responses with per-entry expiry."""
+
+    def __init__(self, max_size: int = 256, ttl: float = 3600.0):
+        """Initialize response cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(payload: bytes) -> str:
+        """Build a cache key from an encoded request payload."""
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
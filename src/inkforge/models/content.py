@@ -1,6 +1,7 @@
 """Content models for InkForge."""
 
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field, validator
 
@@ -128,6 +129,18 @@ class ContentResponse(BaseModel):
             return max(1, round(values['word_count'] / 200))
         return v or 1
 
+    def preview(self, max_chars: int = 300) -> str:
+        """Get the first ``max_chars`` characters of content, with an ellipsis if truncated."""
+        content = self.content
+        if len(content) > max_chars:
+            return f"{content[:max_chars]}..."
+        return content
+
+    @cached_property
+    def tags_str(self) -> str:
+        """Get tags as a comma-separated string."""
+        return ", ".join(self.tags)
+
 
 class GenerationConfig(BaseModel):
     """Configuration for content generation."""
@@ -138,6 +151,7 @@ class GenerationConfig(BaseModel):
     top_p: float = Field(default=0.9, description="Top-p sampling parameter", ge=0.0, le=1.0)
     frequency_penalty: float = Field(default=0.0, description="Frequency penalty", ge=-2.0, le=2.0)
     presence_penalty: float = Field(default=0.0, description="Presence penalty", ge=-2.0, le=2.0)
+    system_prompt: Optional[str] = Field(default=None, description="Static instructions sent ahead of the prompt")
     
     # Processing options
     enable_humanization: bool = Field(default=True, description="Enable humanization processing")
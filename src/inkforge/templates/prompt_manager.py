@@ -8,6 +8,11 @@ from jinja2 import Environment, FileSystemLoader, Template
 from ..models.content import ContentRequest, Country, Industry, Platform, Tone, Goal
 
 
+# System prompt for several requests packed into one call; answers are split back out by id
+BATCH_SYSTEM_PROMPT = """You will receive several independent content requests, each wrapped in <question id=N> tags.
+
+Complete every request in full. Wrap each answer in <answer id=N>...</answer> tags using the id of its request, and write nothing outside the answer tags."""
+
 class PromptManager:
     """Manages prompt templates for different countries, platforms, and industries."""
     
@@ -49,6 +54,12 @@ class PromptManager:
     def _get_default_mappings(self) -> Dict[str, Any]:
         """Get default template mappings."""
         return {
+            "system_templates": {
+                "US": "system_english.j2",
+                "UK": "system_english.j2",
+                "CN": "system_chinese.j2",
+                "IN": "system_english.j2",
+            },
             "country_templates": {
                 "US": "base_english.j2",
                 "UK": "base_english.j2",
@@ -105,6 +116,8 @@ class PromptManager:
     def _ensure_default_templates(self):
         """Ensure default templates exist."""
         templates_to_create = [
+            ("system_english.j2", self._get_system_english_template()),
+            ("system_chinese.j2", self._get_system_chinese_template()),
             ("base_english.j2", self._get_base_english_template()),
             ("base_chinese.j2", self._get_base_chinese_template()),
             ("platform_medium.j2", self._get_platform_medium_template()),
@@ -121,8 +134,19 @@ class PromptManager:
             if not template_file.exists():
                 template_file.write_text(template_content, encoding='utf-8')
     
+    def generate_system_prompt(self, request: ContentRequest) -> str:
+        """Generate the static instructions for the request's language.
+
+        They do not depend on the topic or other per-request details, so they
+        are sent as a system message that providers can cache across requests.
+        """
+        template_name = self.mappings.get("system_templates", {}).get(
+            request.country.value, "system_english.j2"
+        )
+        return self.env.get_template(template_name).render()
+
     def generate_prompt(self, request: ContentRequest) -> str:
-        """Generate a complete prompt based on the request."""
+        """Generate the per-request prompt that follows the system prompt."""
         # Get base template
         base_template_name = self.mappings["country_templates"].get(
             request.country.value, "base_english.j2"
@@ -159,7 +183,7 @@ class PromptManager:
         
         # Render base template
         base_template = self.env.get_template(base_template_name)
-        base_prompt = base_template.render(**context)
+        base_prompt = base_template.render(**context).strip()
         
         # Render and combine modifiers
         modifiers = []
@@ -179,25 +203,18 @@ class PromptManager:
             full_prompt += "\n\nAdditional Requirements:\n" + "\n".join(f"- {mod}" for mod in modifiers)
         
         return full_prompt
+
+    def generate_batch_prompt(self, requests: List[ContentRequest]) -> str:
+        """Generate one prompt covering several requests, numbered from 1."""
+        return "\n\n".join(
+            f"<question id={index}>\n{self.generate_system_prompt(request)}\n\n{self.generate_prompt(request)}\n</question>"
+            for index, request in enumerate(requests, 1)
+        )
     
-    def _get_base_english_template(self) -> str:
-        """Get base English template."""
+    def _get_system_english_template(self) -> str:
+        """Get system English template."""
         return """You are an expert content creator specializing in high-quality blog posts for global audiences.
 
-Create an engaging, well-structured blog post about "{{ topic }}" with the following specifications:
-
-**Target Audience:** {{ country }} readers
-**Industry Focus:** {{ industry }}
-**Platform:** {{ platform }}
-**Tone:** {{ tone }}
-**Goal:** {{ goal }}
-**Language:** {{ language }}
-**Target Length:** Approximately {{ length }} words
-
-{% if keywords %}
-**Keywords to Include:** {{ keywords | join(', ') }}
-{% endif %}
-
 **Content Structure Requirements:**
 1. Compelling headline that grabs attention
 2. Engaging introduction with a hook
@@ -212,34 +229,16 @@ Create an engaging, well-structured blog post about "{{ topic }}" with the follo
 - Make it engaging and shareable
 - Optimize for the target platform's audience preferences
 
-{% if custom_instructions %}
-**Additional Instructions:** {{ custom_instructions }}
-{% endif %}
-
-Please provide:
+For each blog post, please provide:
 1. A compelling title
 2. The complete blog post content
 3. Suggested tags (3-5 tags)
 4. Brief engagement tips for this specific content"""
     
-    def _get_base_chinese_template(self) -> str:
-        """Get base Chinese template."""
+    def _get_system_chinese_template(self) -> str:
+        """Get system Chinese template."""
         return """你是一位专业的内容创作专家，专门为全球受众创作高质量的博客文章。
 
-请创作一篇关于"{{ topic }}"的引人入胜、结构良好的博客文章，具体要求如下：
-
-**目标受众：** {{ country }} 读者
-**行业重点：** {{ industry }}
-**平台：** {{ platform }}
-**语调：** {{ tone }}
-**目标：** {{ goal }}
-**语言：** {{ language }}
-**目标长度：** 大约 {{ length }} 字
-
-{% if keywords %}
-**需要包含的关键词：** {{ keywords | join('、') }}
-{% endif %}
-
 **内容结构要求：**
 1. 吸引人的标题
 2. 有钩子的引人入胜的开头
@@ -254,16 +253,50 @@ Please provide:
 - 让内容引人入胜且易于分享
 - 针对目标平台的受众偏好进行优化
 
-{% if custom_instructions %}
-**额外说明：** {{ custom_instructions }}
-{% endif %}
-
-请提供：
+每篇文章请提供：
 1. 一个引人注目的标题
 2. 完整的博客文章内容
 3. 建议的标签（3-5个标签）
 4. 针对此特定内容的简要互动提示"""
     
+    def _get_base_english_template(self) -> str:
+        """Get base English template."""
+        return """Create an engaging, well-structured blog post about "{{ topic }}" with the following specifications:
+
+**Target Audience:** {{ country }} readers
+**Industry Focus:** {{ industry }}
+**Platform:** {{ platform }}
+**Tone:** {{ tone }}
+**Goal:** {{ goal }}
+**Language:** {{ language }}
+**Target Length:** Approximately {{ length }} words
+{% if keywords %}
+**Keywords to Include:** {{ keywords | join(', ') }}
+{% endif %}
+{% if custom_instructions %}
+
+**Additional Instructions:** {{ custom_instructions }}
+{% endif %}"""
+    
+    def _get_base_chinese_template(self) -> str:
+        """Get base Chinese template."""
+        return """请创作一篇关于"{{ topic }}"的引人入胜、结构良好的博客文章，具体要求如下：
+
+**目标受众：** {{ country }} 读者
+**行业重点：** {{ industry }}
+**平台：** {{ platform }}
+**语调：** {{ tone }}
+**目标：** {{ goal }}
+**语言：** {{ language }}
+**目标长度：** 大约 {{ length }} 字
+{% if keywords %}
+**需要包含的关键词：** {{ keywords | join('、') }}
+{% endif %}
+{% if custom_instructions %}
+
+**额外说明：** {{ custom_instructions }}
+{% endif %}"""
+    
     def _get_platform_medium_template(self) -> str:
         """Get Medium platform modifier."""
         return """Optimize for Medium's audience: Use subheadings, bullet points, and readable paragraphs. Include a compelling subtitle."""
@@ -0,0 +1,18 @@
+"""Shared Rich console for InkForge."""
+
+from rich.console import Console
+
+
+_console = None
+
+
+def get_console() -> Console:
+    """Get the process-wide console, creating it on first use.
+
+    Sharing one console keeps progress displays, demo output and log messages
+    from interleaving their escape sequences on the terminal.
+    """
+    global _console
+    if _console is None:
+        _console = Console(highlight=False, soft_wrap=True)
+    return _console
@@ -0,0 +1,25 @@
+"""File writing helpers for InkForge."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+# The umask is process-wide and can only be read by setting it, so read it once
+# at import rather than toggling it while other threads may be creating files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write a file via a temporary sibling and rename, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(chunks)
+        # mkstemp creates the file owner-only; use the normal permissions instead
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,6 +1,5 @@
 """Output formatters for InkForge."""
 
-import json
 import html
 import re
 from datetime import datetime
@@ -40,7 +39,7 @@ class MarkdownFormatter(OutputFormatter):
             output.append(f"**Reading Time:** {response.estimated_read_time} minutes")
             
             if response.tags:
-                output.append(f"**Tags:** {', '.join(response.tags)}")
+                output.append(f"**Tags:** {response.tags_str}")
             
             generation_time = response.metadata.get("generation_time", "")
             if generation_time:
@@ -255,13 +254,11 @@ class JSONFormatter(OutputFormatter):
     
     def format(self, response: ContentResponse, **kwargs) -> str:
         """Format content as JSON."""
-        data = response.dict()
-        
-        # Add formatting options
+        # Serialize in pydantic-core rather than building a dict for json.dumps
         if kwargs.get("pretty", True):
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return response.model_dump_json(indent=2)
         else:
-            return json.dumps(data, ensure_ascii=False)
+            return response.model_dump_json()
     
     def get_file_extension(self) -> str:
         """Get file extension."""
@@ -286,7 +283,7 @@ class PlainTextFormatter(OutputFormatter):
             output.append(f"Reading Time: {response.estimated_read_time} minutes")
             
             if response.tags:
-                output.append(f"Tags: {', '.join(response.tags)}")
+                output.append(f"Tags: {response.tags_str}")
             
             output.append("")
             output.append("-" * 50)
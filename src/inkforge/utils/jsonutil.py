@@ -0,0 +1,30 @@
+"""JSON helpers for InkForge.
+
+Uses orjson when it is installed (``pip install inkforge[speedups]``) and the
+standard library otherwise. Output is always UTF-8 text, never ASCII-escaped.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize an object to JSON, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=default)
@@ -0,0 +1,47 @@
+"""Session file layout for InkForge.
+
+A session directory holds ``session_header.json``, written once when the
+session starts, and ``generations.jsonl``, with one line appended per
+generation. ``session_data.json`` combines both and is written when the
+generator is closed; sessions saved by older versions only have that file.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from . import jsonutil
+
+SESSION_HEADER_FILE = "session_header.json"
+GENERATIONS_LOG_FILE = "generations.jsonl"
+SESSION_DATA_FILE = "session_data.json"
+
+
+def session_mtime_ns(session_dir: Union[str, Path]) -> Optional[int]:
+    """Get the modification time of the file last written for a session, or None if it has none."""
+    for name in (GENERATIONS_LOG_FILE, SESSION_HEADER_FILE, SESSION_DATA_FILE):
+        try:
+            return os.stat(os.path.join(session_dir, name)).st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def read_session_data(session_dir: Union[str, Path]) -> Dict[str, Any]:
+    """Read a session's details and generations.
+
+    Raises ``OSError`` or ``ValueError`` if the session cannot be read.
+    """
+    try:
+        with open(os.path.join(session_dir, SESSION_HEADER_FILE), 'rb') as f:
+            session_data = jsonutil.loads(f.read())
+    except FileNotFoundError:
+        with open(os.path.join(session_dir, SESSION_DATA_FILE), 'rb') as f:
+            return jsonutil.loads(f.read())
+
+    try:
+        with open(os.path.join(session_dir, GENERATIONS_LOG_FILE), 'rb') as f:
+            session_data["generations"] = [jsonutil.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        session_data["generations"] = []
+    return session_data
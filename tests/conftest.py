@@ -152,6 +152,13 @@ def clean_environment():
         os.environ[var] = value
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry failed requests without sleeping between attempts."""
+    monkeypatch.setattr("inkforge.core.generator.RETRY_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr("inkforge.core.ai_service.TRANSIENT_BACKOFF_BASE", 0.0)
+
+
 @pytest.fixture
 def mock_http_client():
     """Mock HTTP client for API testing."""
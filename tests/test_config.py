@@ -4,12 +4,12 @@ import os
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 
 import pytest
 import toml
 
-from inkforge.core.config import Config
+from inkforge.core.config import Config, _read_toml
 
 
 class TestConfig:
@@ -105,6 +105,35 @@ class TestConfig:
         finally:
             config_file.unlink()
     
+    def test_config_file_parse_cache(self):
+        """Test unchanged config files are parsed once."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
+            toml.dump({'default_model': 'cached-model'}, f)
+            config_file = Path(f.name)
+        
+        try:
+            read_toml = Mock(wraps=_read_toml)
+            with patch.dict('inkforge.core.config._CONFIG_LOADERS', {'.toml': read_toml}):
+                assert Config(config_file=config_file).default_model == 'cached-model'
+                assert Config(config_file=config_file).default_model == 'cached-model'
+                assert read_toml.call_count == 1
+            
+            # Rewriting the file invalidates the cached parse
+            config_file.write_text(toml.dumps({'default_model': 'updated-model'}))
+            assert Config(config_file=config_file).default_model == 'updated-model'
+        finally:
+            config_file.unlink()
+    
+    def test_find_default_config(self, temp_dir, monkeypatch):
+        """Test default config discovery follows name priority."""
+        (temp_dir / ".inkforge.json").write_text('{"default_model": "hidden-model"}')
+        (temp_dir / "inkforge.json").write_text('{"default_model": "visible-model"}')
+        monkeypatch.chdir(temp_dir)
+        
+        config = Config()
+        assert config._find_default_config() == temp_dir / "inkforge.json"
+        assert config.default_model == "visible-model"
+    
     def test_config_precedence(self):
         """Test configuration precedence (file overrides env, explicit overrides both)."""
         # Set environment variable
@@ -184,6 +213,11 @@ class TestConfig:
         assert headers["Content-Type"] == "application/json"
         assert "HTTP-Referer" in headers
         assert "X-Title" in headers
+        
+        # Cached until the API key changes
+        assert config.get_headers() is headers
+        config.openrouter_api_key = "other-key"
+        assert config.get_headers()["Authorization"] == "Bearer other-key"
     
     def test_get_headers_no_key(self):
         """Test headers generation without API key."""
@@ -227,6 +261,23 @@ class TestConfig:
         with pytest.raises(ValueError, match="Unknown configuration key"):
             config.set('invalid_key', 'value')
     
+    def test_batched_set_saves_once(self, temp_dir):
+        """Test set() calls inside batch() write the config file once."""
+        config_file = temp_dir / "config.toml"
+        config = Config(config_file=config_file)
+        config.save()
+        
+        with patch.object(Config, 'save', autospec=True, side_effect=Config.save) as save:
+            with config.batch():
+                config.set('default_model', 'batched-model')
+                config.set('temperature', 0.3)
+                assert save.call_count == 0
+            assert save.call_count == 1
+        
+        saved = toml.load(config_file)
+        assert saved['default_model'] == 'batched-model'
+        assert saved['temperature'] == 0.3
+    
     def test_reset_to_defaults(self):
         """Test resetting configuration to defaults."""
         config = Config()
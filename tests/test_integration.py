@@ -1,16 +1,23 @@
 """Integration tests for InkForge."""
 
+import asyncio
 import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
+from inkforge.core.ai_service import AIService, AIServiceError, AIServiceManager
+from inkforge.core.llm_cache import ResponseCache
 from inkforge.core.config import Config
 from inkforge.core.generator import ContentGenerator
-from inkforge.models.content import ContentRequest, Country, Industry, Platform
+from inkforge.models.content import ContentRequest, ContentResponse, Country, Industry, Platform, GenerationConfig
+from inkforge.utils import jsonutil
 from inkforge.utils.formatters import format_content, OutputFormat
+from inkforge.utils.sessions import read_session_data
 
 
 class TestIntegration:
@@ -191,6 +198,378 @@ Engagement Tips: Ask about reader experiences with AI healthcare tools"""
             # Language should be set correctly
             assert request.language is not None
     
+    def test_batch_generation(self, temp_dir):
+        """Test generating several requests as one batch."""
+        config = Config()
+        config.openrouter_api_key = "demo-mode"
+        config.default_output_dir = str(temp_dir)
+        config.min_quality_score = 0.0
+        generator = ContentGenerator(config)
+        
+        requests = [
+            ContentRequest(topic="Batch Topic One", country=Country.US),
+            ContentRequest(topic="Batch Topic Two", country=Country.CN, platform=Platform.ZHIHU),
+        ]
+        
+        responses = generator.generate_batch(
+            requests,
+            save_formats=[[OutputFormat.MARKDOWN], [OutputFormat.PLAIN]],
+        )
+        
+        assert len(responses) == 2
+        # Check the unprocessed title and request params; the processors randomize the body
+        assert "Batch Topic One" in responses[0].title
+        assert "Batch Topic Two" in responses[1].title
+        assert responses[0].metadata["request_params"]["topic"] == "Batch Topic One"
+        assert responses[1].metadata["request_params"]["topic"] == "Batch Topic Two"
+        
+        # Each generation gets its own directory even when started in the same second
+        generation_ids = {g["generation_id"] for g in generator.session_data["generations"]}
+        assert len(generation_ids) == 2
+        
+        # Formatted outputs are written in the background
+        generator.wait_for_saves()
+        assert len(list(generator.session_dir.glob("*/*_gen_*.md"))) == 1
+        assert len(list(generator.session_dir.glob("*/*_gen_*.txt"))) == 1
+        assert len(list(generator.session_dir.glob("*/metadata.json"))) == 2
+        assert len(list(generator.session_dir.glob("*/prompt.txt"))) == 2
+        
+        # Generations are appended to the session log; the combined file is written on close
+        assert len(read_session_data(generator.session_dir)["generations"]) == 2
+        assert not (generator.session_dir / "session_data.json").exists()
+        generator.close()
+        assert read_session_data(generator.session_dir)["session_id"] == generator.session_id
+        assert (generator.session_dir / "session_data.json").exists()
+        
+        with pytest.raises(ValueError, match="one entry per request"):
+            generator.generate_batch(requests, save_formats=[[OutputFormat.MARKDOWN]])
+    
+    def test_packed_batch_generation(self, temp_dir):
+        """Test packing several requests into one AI call."""
+        config = Config()
+        config.openrouter_api_key = "demo-mode"
+        config.default_output_dir = str(temp_dir)
+        config.min_quality_score = 0.0
+        generator = ContentGenerator(config)
+
+        requests = [ContentRequest(topic=f"Packed Topic {n}") for n in range(3)]
+        with patch.object(AIService, 'generate_content', autospec=True, side_effect=AIService.generate_content) as mock_generate:
+            responses = generator.generate_batch(requests, auto_save=False, pack_size=2)
+
+        # Two packs: one holding two requests, one left over
+        assert mock_generate.call_count == 2
+        assert "<question id=2>" in mock_generate.call_args_list[0].args[1]
+        assert [response.title for response in responses] == [
+            f"Packed Topic {n}: A Comprehensive Guide" for n in range(3)
+        ]
+        assert responses[0].metadata["batch_size"] == 2
+        assert "batch_size" not in responses[2].metadata
+
+    def test_response_cache(self, temp_dir):
+        """Test that identical requests are served from the response cache."""
+        config = Config()
+        config.openrouter_api_key = "demo-mode"
+        config.default_output_dir = str(temp_dir / "output")
+        config.min_quality_score = 0.0
+        cache_dir = temp_dir / "cache"
+        
+        request = ContentRequest(topic="Cached Topic")
+        first = ContentGenerator(config, cache_dir=cache_dir).generate(request, auto_save=False)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        
+        # A fresh generator must hit the on-disk cache without calling the AI service
+        generator = ContentGenerator(config, cache_dir=cache_dir)
+        with patch('inkforge.core.generator.AIService') as mock_service:
+            second = generator.generate(request, auto_save=False)
+            mock_service.assert_not_called()
+        
+        assert second == first
+        
+        # Different generation settings produce a different key
+        original_key = generator._cache_key(request)
+        config.temperature = 0.1
+        assert generator._cache_key(request) != original_key
+    
+    @pytest.mark.asyncio
+    async def test_generator_reuses_ai_service(self, temp_dir):
+        """Test generations share one AI service until the generator is closed."""
+        config = Config()
+        config.openrouter_api_key = "demo-mode"
+        config.default_output_dir = str(temp_dir)
+        config.min_quality_score = 0.0
+
+        async with ContentGenerator(config) as generator:
+            await generator.generate_async(ContentRequest(topic="First Topic"), auto_save=False)
+            service = generator._ai_service
+            await generator.generate_async(ContentRequest(topic="Second Topic"), auto_save=False)
+            assert generator._ai_service is service
+
+        assert generator._ai_service is None
+        assert service.client.is_closed
+
+    def test_format_cache(self, temp_dir):
+        """Test identical responses are formatted once per format."""
+        config = Config()
+        config.default_output_dir = str(temp_dir)
+        generator = ContentGenerator(config)
+        response = ContentResponse(title="Title", content="Body text", word_count=2, estimated_read_time=1)
+
+        with patch('inkforge.core.generator.format_content', return_value="formatted") as mock_format:
+            generator._format_response(response, OutputFormat.HTML)
+            generator._format_response(response.model_copy(deep=True), OutputFormat.HTML)
+            assert mock_format.call_count == 1
+
+            generator._format_response(response, OutputFormat.MARKDOWN)
+            response.metadata["changed"] = True
+            generator._format_response(response, OutputFormat.HTML)
+            assert mock_format.call_count == 3
+
+    def test_generators_share_session_logger(self, temp_dir):
+        """Test generators in the same session reuse one logger and log file."""
+        config = Config()
+        config.default_output_dir = str(temp_dir)
+        with patch('inkforge.core.generator.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 12, 1, 14, 30, 22)
+            first = ContentGenerator(config)
+            second = ContentGenerator(config)
+
+        assert second.logger is first.logger
+        assert len(first.logger.handlers) == 2
+
+        # Handlers stay open until the last generator in the session closes
+        first.close()
+        assert len(second.logger.handlers) == 2
+        second.close()
+        second.close()
+        assert second.logger.handlers == []
+
+    def test_retry_delay(self, temp_dir, monkeypatch):
+        """Test backoff between failed generation attempts."""
+        monkeypatch.setattr("inkforge.core.generator.RETRY_BACKOFF_BASE", 1.0)
+        config = Config()
+        config.default_output_dir = str(temp_dir)
+        generator = ContentGenerator(config)
+        
+        def status_error(status_code):
+            request = httpx.Request("POST", "https://example.com")
+            response = httpx.Response(status_code, request=request)
+            error = AIServiceError("API request failed")
+            error.__cause__ = httpx.HTTPStatusError("request failed", request=request, response=response)
+            return error
+        
+        # Exponential backoff with jitter, capped
+        assert 2.0 <= generator._retry_delay(2) <= 4.0
+        assert generator._retry_delay(20) <= 30.0
+        
+        # Rate-limit and server errors were already retried by the service
+        assert generator._retried_by_service(status_error(429))
+        assert generator._retried_by_service(status_error(503))
+        assert not generator._retried_by_service(status_error(400))
+        assert not generator._retried_by_service(ValueError("bad"))
+    
+    @pytest.mark.asyncio
+    async def test_ai_service_response_cache(self):
+        """Test deterministic AI responses are served from the cache."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            body = b'{"model": "test-model", "choices": [{"message": {"content": "Cached answer"}}]}'
+            return httpx.Response(200, stream=httpx.ByteStream(body))
+        
+        service = AIService(config, cache=ResponseCache())
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            deterministic = GenerationConfig(temperature=0.0)
+            first = await service.generate_content("prompt", deterministic)
+            second = await service.generate_content("prompt", deterministic)
+            assert second.content == first.content == "Cached answer"
+            assert second.metadata["cache_hit"] is True
+            assert len(calls) == 1
+            
+            # Sampled requests always go to the API
+            await service.generate_content("prompt", GenerationConfig(temperature=0.7))
+            assert len(calls) == 2
+            assert service.stats["hits"] == 1
+        finally:
+            await service.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_services_share_client_per_loop(self):
+        """Test services on one event loop share a pooled client."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        
+        first, second = AIService(config), AIService(config)
+        assert first.client is second.client
+        
+        # Closing a service twice must not release the other service's reference
+        await first.aclose()
+        await first.aclose()
+        assert not second.client.is_closed
+        await second.aclose()
+        assert second.client.is_closed
+    
+    def test_manager_service_per_loop(self):
+        """Test the service manager never reuses a service across event loops."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        manager = AIServiceManager(config)
+
+        async def get_services():
+            first = await manager.get_async_service()
+            assert manager.get_service() is first
+            await manager.aclose()
+            assert first.client.is_closed
+            return first
+
+        assert asyncio.run(get_services()) is not asyncio.run(get_services())
+        assert manager.get_service() is manager.get_service()
+
+    def test_ai_service_pickle(self):
+        """Test services can be pickled and get a fresh client."""
+        import pickle
+        
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        service = AIService(config)
+        
+        restored = pickle.loads(pickle.dumps(service))
+        assert restored.client is not service.client
+        assert restored.cache is service.cache
+        assert restored._chat_url == service._chat_url
+    
+    def test_transient_errors_retried(self):
+        """Test 429/5xx responses are retried before failing."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        statuses = [503, 429, 200]
+        
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"})
+            body = b'{"model": "test-model", "choices": [{"message": {"content": "Recovered"}}]}'
+            return httpx.Response(200, stream=httpx.ByteStream(body))
+        
+        service = AIService(config)
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        assert service.generate_content_sync("prompt").content == "Recovered"
+        assert statuses == []
+    
+    @pytest.mark.asyncio
+    async def test_transient_errors_not_retried_twice(self, temp_dir):
+        """Test the generator leaves rate-limit and server errors to the service's retries."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        config.default_output_dir = str(temp_dir)
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+        
+        generator = ContentGenerator(config)
+        generator._get_ai_service().client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        with pytest.raises(AIServiceError):
+            await generator.generate_async(ContentRequest(topic="Retry Test"), auto_save=False)
+        assert len(calls) == 3  # the service's attempts only
+        generator.close()
+    
+    def test_sync_wrappers_reuse_client(self):
+        """Test synchronous calls share one event loop and connection pool."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, stream=httpx.ByteStream(b'{"data": [{"id": "test-model"}]}'))
+        
+        service = AIService(config)
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        assert service.get_available_models_sync() == [{"id": "test-model"}]
+        assert service.validate_model_sync("test-model") is True
+        assert service.validate_model_sync("other-model") is False
+        assert len(calls) == 2  # validation reuses the fetched model ids
+        assert not service.client.is_closed
+    
+    def test_models_revalidated_by_etag(self):
+        """Test the model list is reused when the server answers 304."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        seen_etags = []
+        
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == "v1":
+                return httpx.Response(304)
+            body = b'{"data": [{"id": "test-model"}]}'
+            return httpx.Response(200, headers={"ETag": "v1"}, stream=httpx.ByteStream(body))
+        
+        service = AIService(config)
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        assert service.get_available_models_sync() == [{"id": "test-model"}]
+        assert service.get_available_models_sync() == [{"id": "test-model"}]
+        assert seen_etags == [None, "v1"]
+    
+    def test_ai_service_batch(self):
+        """Test batch generation keeps prompt order."""
+        config = Config()
+        config.openrouter_api_key = "demo-mode"
+        service = AIService(config)
+        
+        responses = service.generate_content_batch_sync(['"First"', '"Second"'], max_concurrency=1)
+        assert [r.content.split(":")[0] for r in responses] == ["# First", "# Second"]
+    
+    def test_payload_puts_system_prompt_first(self):
+        """Test static instructions lead the message list."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        service = AIService(config)
+        
+        payload = jsonutil.loads(service._build_payload("topic", GenerationConfig(system_prompt="rules"), stream=False))
+        assert payload["stream"] is False
+        assert payload["messages"] == [
+            {"role": "system", "content": "rules"},
+            {"role": "user", "content": "topic"},
+        ]
+        
+        anthropic = GenerationConfig(model="anthropic/claude-3-haiku", system_prompt="rules")
+        system_message = jsonutil.loads(service._build_payload("topic", anthropic, stream=True))["messages"][0]
+        assert system_message["content"][0]["cache_control"] == {"type": "ephemeral"}
+    
+    @pytest.mark.asyncio
+    async def test_generation_sends_system_prompt(self, temp_dir):
+        """Test single generations send the static instructions as the system message."""
+        config = Config()
+        config.openrouter_api_key = "test-key"
+        config.default_output_dir = str(temp_dir)
+        payloads = []
+        
+        def handler(request):
+            payloads.append(jsonutil.loads(request.content))
+            return httpx.Response(400)
+        
+        generator = ContentGenerator(config)
+        generator._get_ai_service().client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        with pytest.raises(AIServiceError):
+            await generator.generate_async(ContentRequest(topic="System Prompt Test"), auto_save=False)
+        system_message, user_message = payloads[0]["messages"]
+        assert system_message["role"] == "system"
+        assert "expert content creator" in system_message["content"]
+        assert "System Prompt Test" not in system_message["content"]
+        assert '"System Prompt Test"' in user_message["content"]
+        assert "expert content creator" not in user_message["content"]
+        generator.close()
+    
     def test_error_handling(self):
         """Test error handling in integration scenarios."""
         # Test without API key
@@ -150,6 +150,31 @@ class TestContentResponse:
         assert response.engagement_tips == []
         assert response.platform_specific_notes == []
         assert response.tags == []
+    
+    def test_preview(self):
+        """Test content preview truncation."""
+        response = ContentResponse(
+            title="Test",
+            content="x" * 350,
+            word_count=1,
+            estimated_read_time=1
+        )
+        
+        assert response.preview() == "x" * 300 + "..."
+        assert response.preview(400) == "x" * 350
+
+    def test_tags_str(self):
+        """Test comma-separated tags."""
+        response = ContentResponse(
+            title="Test",
+            content="Test content",
+            word_count=2,
+            estimated_read_time=1,
+            tags=["ai", "tech"]
+        )
+
+        assert response.tags_str == "ai, tech"
+        assert "tags_str" not in response.dict()
 
 
 class TestGenerationConfig: